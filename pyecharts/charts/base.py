@@ -1,8 +1,13 @@
 import datetime
+import decimal
+import json as _json
+import re
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 
 import simplejson as json
 from jinja2 import Environment
+from simplejson.encoder import encode_basestring_ascii
 
 from ..commons import utils
 from ..globals import CurrentConfig, RenderType, ThemeType
@@ -10,7 +15,7 @@ from ..options import InitOpts
 from ..options.global_options import AnimationOpts
 from ..options.series_options import BasicOpts
 from ..render import engine
-from ..types import Optional, Sequence, Union
+from ..types import Any, List, Optional, Sequence, Tuple, Union
 from .mixins import ChartMixin
 
 
@@ -32,26 +37,29 @@ class Base(ChartMixin):
         self.theme = _opts.get("theme", ThemeType.WHITE)
         self.chart_id = _opts.get("chart_id") or uuid.uuid4().hex
 
-        self.options: dict = {}
+        self.options: dict = utils.TrackedDict()
         self.js_host: str = _opts.get("js_host") or CurrentConfig.ONLINE_HOST
         self.js_functions: utils.OrderedSet = utils.OrderedSet()
         self.js_dependencies: utils.OrderedSet = utils.OrderedSet("echarts")
         self.options.update(backgroundColor=_opts.get("bg_color"))
         self.options.update(_opts.get("animationOpts", AnimationOpts()).opts)
+        self.is_compact_json: Optional[bool] = _opts.get("is_compact_json")
+        self.is_cache_json: bool = bool(_opts.get("is_cache_json"))
+        self.is_typed_array: bool = bool(_opts.get("is_typed_array"))
+        self._json_cache: dict = {}
+        self._json_cache_owner: Optional[dict] = None
         self._is_geo_chart: bool = False
 
     def get_options(self) -> dict:
         return utils.remove_key_with_none_value(self.options)
 
     def dump_options(self) -> str:
-        return utils.replace_placeholder(
-            json.dumps(self.get_options(), indent=4, default=default, ignore_nan=True)
-        )
+        encoder = self._options_encoder()
+        return encoder.encode(self._options_to_dump(encoder))
 
     def dump_options_with_quotes(self) -> str:
-        return utils.replace_placeholder_with_quotes(
-            json.dumps(self.get_options(), indent=4, default=default, ignore_nan=True)
-        )
+        encoder = self._options_encoder(js_code_quotes=True)
+        return encoder.encode(self._options_to_dump(encoder))
 
     def render(
         self,
@@ -63,6 +71,16 @@ class Base(ChartMixin):
         self._prepare_render()
         return engine.render(self, path, template_name, env, **kwargs)
 
+    def render_stream(
+        self,
+        stream: Any,
+        template_name: str = "simple_chart.html",
+        env: Optional[Environment] = None,
+        **kwargs,
+    ) -> Optional[str]:
+        self._prepare_render()
+        return engine.render_stream(self, stream, template_name, env, **kwargs)
+
     def render_embed(
         self,
         template_name: str = "simple_chart.html",
@@ -79,6 +97,80 @@ class Base(ChartMixin):
             self, "nb_jupyter_notebook.html", "nb_jupyter_lab.html"
         )
 
+    def _options_encoder(self, js_code_quotes: bool = False):
+        is_compact = self.is_compact_json
+        if is_compact is None:
+            is_compact = CurrentConfig.COMPACT_JSON
+        return OptionsEncoder(
+            indent=None if is_compact else 4, js_code_quotes=js_code_quotes
+        )
+
+    def _options_to_dump(self, encoder: "OptionsEncoder") -> dict:
+        """
+        The options to encode. With `is_cache_json` the JSON of every top-level
+        option is kept along with the version of its key in `self.options`, and
+        only the options touched since the last dump are encoded again.
+
+        Only the accesses through `self.options` are tracked: an option
+        changed through a reference taken before the dump (e.g. a series list
+        kept in a variable) is not encoded again until its key is touched.
+        """
+        if not self.is_cache_json:
+            return self._with_typed_arrays(self.options)
+        if not isinstance(self.options, utils.TrackedDict):
+            self.options = utils.TrackedDict(self.options)
+        options = self.options
+        values = self._with_typed_arrays(options)
+        if self._json_cache_owner is not options:
+            self._json_cache = {}
+            self._json_cache_owner = options
+        cache = self._json_cache.setdefault(
+            (encoder.indent, encoder.js_code_quotes), {}
+        )
+        for key in [k for k in cache if k not in options]:
+            del cache[key]
+
+        dirty, kept = [], []
+        for key, value in values.items():
+            if value is None or (isinstance(value, str) and not value):
+                # left out, as by the encoder
+                cache.pop(key, None)
+                continue
+            kept.append(key)
+            entry = cache.get(key)
+            if entry is None or entry[0] != options.versions.get(key, 0):
+                dirty.append((key, value))
+        encoded = dump_all([(encoder, value) for _, value in dirty])
+        for (key, _), js in zip(dirty, encoded):
+            js = _Indented(encoder._reindent(js, 1))
+            cache[key] = (options.versions.get(key, 0), js)
+
+        return {key: cache[key][1] for key in kept}
+
+    def _with_typed_arrays(self, options: dict) -> dict:
+        """
+        With `is_typed_array`, the options where the series data held in
+        numeric buffers (numpy arrays, array.array...) is sent as typed arrays,
+        decoded in the browser by a function added to `js_functions`. Only
+        for the series types of `TYPED_ARRAY_DIMENSIONS`, when the data has
+        as many columns, other data is left to the JSON encoder.
+        """
+        # read without touching the version of a tracked "series"
+        series = dict.get(options, "series")
+        if not self.is_typed_array or not isinstance(series, list):
+            return options
+        typed = []
+        for s in series:
+            if isinstance(s, dict):
+                data, series_type = s.get("data"), s.get("type")
+                if utils.TypedArray.accepts(data, series_type):
+                    s = dict(s, data=utils.TypedArray(data, series_type))
+            typed.append(s)
+        if all(s is t for s, t in zip(series, typed)):
+            return options
+        self.js_functions.add(utils.TYPED_ARRAY_DECODER)
+        return dict(options, series=typed)
+
     def _use_theme(self):
         if self.theme not in ThemeType.BUILTIN_THEMES:
             self.js_dependencies.add(self.theme)
@@ -95,8 +187,244 @@ def default(o):
         return (
             o.replace("\\n|\\t", "").replace(r"\\n", "\n").replace(r"\\t", "\t").js_code
         )
+    if isinstance(o, utils.TypedArray):
+        return o.to_js()
+    if utils.is_buffer(o):
+        return o.tolist()
+    if isinstance(o, utils.ColumnarData):
+        return list(o)
     if isinstance(o, BasicOpts):
         if isinstance(o.opts, Sequence):
             return [utils.remove_key_with_none_value(item) for item in o.opts]
         else:
             return utils.remove_key_with_none_value(o.opts)
+
+
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+_PLACEHOLDER = "--x_x--0_0--"
+
+
+def _is_plain(o) -> bool:
+    t = type(o)
+    if t in _PLAIN_TYPES:
+        return True
+    if t is list or t is tuple:
+        return all(type(v) in _PLAIN_TYPES for v in o)
+    return False
+
+
+def _numeric_values(data) -> Tuple[list, bool]:
+    """
+    Convert a numeric buffer into a list. NaN and Infinity in numpy float arrays
+    are replaced by None in a vectorized way; the second value tells whether the
+    list is known to hold finite numbers only.
+    """
+    kind = getattr(getattr(data, "dtype", None), "kind", None)
+    if kind == "f":
+        import numpy
+
+        finite = numpy.isfinite(data)
+        if not finite.all():
+            data = numpy.where(finite, data, None)
+    return data.tolist(), kind is not None
+
+
+class _Indented(json.RawJSON):
+    """JSON already indented for the level it is written at"""
+
+
+class OptionsEncoder:
+    """
+    `OptionsEncoder` serializes chart options to JSON in a single pass.
+    Keys whose value is None or an empty string are dropped, `BasicOpts` are
+    unwrapped and `JsCode` is written out without quotes, so neither
+    `utils.remove_key_with_none_value` nor `utils.replace_placeholder` has to
+    walk the tree again. Arrays holding only plain values are handed over to
+    the C encoder of simplejson as a whole.
+    """
+
+    def __init__(self, indent: Optional[int] = 4, js_code_quotes: bool = False):
+        self.indent = indent
+        self.js_code_quotes = js_code_quotes
+        self.key_separator = ": " if indent is not None else ":"
+        self._plain_encode = json.JSONEncoder(
+            indent=indent,
+            separators=(",", self.key_separator),
+            ignore_nan=True,
+            namedtuple_as_object=False,
+        ).encode
+
+    def encode(self, o) -> str:
+        return "".join(self.iterencode(o))
+
+    def iterencode(self, o):
+        return self._iterencode(o, 0)
+
+    def _newline(self, level: int) -> str:
+        if self.indent is None:
+            return ""
+        return "\n" + " " * (self.indent * level)
+
+    def _iterencode(self, o, level: int):
+        if isinstance(o, dict):
+            yield from self._iterencode_dict(o, level)
+        elif isinstance(o, (list, tuple, set)):
+            yield from self._iterencode_list(o, level)
+        elif isinstance(o, BasicOpts):
+            opts = o.opts
+            if isinstance(opts, Sequence):
+                opts = [
+                    item if isinstance(item, dict) else item or None for item in opts
+                ]
+            yield from self._iterencode(opts, level)
+        elif isinstance(o, utils.JsCode):
+            yield self._encode_js_code(o)
+        elif isinstance(o, _Indented):
+            yield o.encoded_json
+        elif isinstance(o, json.RawJSON):
+            yield self._reindent(o.encoded_json, level)
+        elif isinstance(o, str):
+            yield encode_basestring_ascii(o)
+        elif o is None:
+            yield "null"
+        elif o is True:
+            yield "true"
+        elif o is False:
+            yield "false"
+        elif isinstance(o, int):
+            yield int.__repr__(o)
+        elif isinstance(o, float):
+            yield self._plain_encode(o)
+        elif isinstance(o, utils.ColumnarData):
+            if all(map(utils.is_numeric_buffer, o.columns)):
+                columns = [_numeric_values(c) for c in o.columns]
+                yield self._encode_numeric(
+                    list(zip(*(values for values, _ in columns))),
+                    all(is_finite for _, is_finite in columns),
+                    level,
+                )
+            else:
+                yield from self._iterencode_list(o.rows(), level)
+        elif utils.is_numeric_buffer(o):
+            yield self._encode_numeric(*_numeric_values(o), level)
+        elif isinstance(o, decimal.Decimal):
+            # written as it is, as simplejson does
+            yield str(o)
+        else:
+            yield from self._iterencode(default(o), level)
+
+    def _iterencode_dict(self, dct: dict, level: int):
+        newline = self._newline(level + 1)
+        separator = "{"
+        for key, value in dct.items():
+            if value is None or (isinstance(value, str) and not value):
+                continue
+            if not isinstance(key, str):
+                key = self._stringify_key(key)
+            yield separator + newline + encode_basestring_ascii(key)
+            yield self.key_separator
+            yield from self._iterencode(value, level + 1)
+            separator = ","
+        if separator == "{":
+            yield "{}"
+        else:
+            yield self._newline(level) + "}"
+
+    def _iterencode_list(self, seq, level: int):
+        if not seq:
+            yield "[]"
+            return
+        if type(seq) is not set and all(map(_is_plain, seq)):
+            yield self._encode_plain_seq(seq, level)
+            return
+        newline = self._newline(level + 1)
+        separator = "["
+        for value in seq:
+            yield separator + newline
+            yield from self._iterencode(value, level + 1)
+            separator = ","
+        yield self._newline(level) + "]"
+
+    def _encode_plain_seq(self, seq, level: int) -> str:
+        return self._reindent(self._plain_encode(seq), level)
+
+    def _reindent(self, chunk: str, level: int) -> str:
+        if level and self.indent is not None:
+            chunk = chunk.replace("\n", self._newline(level))
+        return chunk
+
+    def _dedent(self, chunk: str, level: int) -> str:
+        # the inverse of `_reindent`
+        if level and self.indent is not None:
+            chunk = chunk.replace(self._newline(level), "\n")
+        return chunk
+
+    def _encode_numeric(self, values: list, is_finite: bool, level: int) -> str:
+        if is_finite and self.indent is None:
+            # the C encoder of the standard library formats floats much faster
+            return _json.dumps(values, separators=(",", ":"))
+        return self._encode_plain_seq(values, level)
+
+    def _stringify_key(self, key) -> str:
+        if key is True:
+            return "true"
+        if key is False:
+            return "false"
+        if key is None:
+            return "null"
+        if isinstance(key, (int, float)):
+            return self._plain_encode(key)
+        raise TypeError(
+            "keys must be str, int, float, bool or None, not {!r}".format(key)
+        )
+
+    def _encode_js_code(self, o: utils.JsCode) -> str:
+        code = re.sub("\\n|\\t", "", o.js_code)
+        code = re.sub(r"\\n", "\n", code)
+        code = re.sub(r"\\t", "\t", code)
+        code = encode_basestring_ascii(code).replace(_PLACEHOLDER, "")
+        if self.js_code_quotes:
+            return code
+        return code[1:-1]
+
+
+_process_pools: dict = {}
+
+
+def _dump_executor():
+    executor = CurrentConfig.DUMP_EXECUTOR
+    if isinstance(executor, int):
+        if executor < 2:
+            return None
+        if executor not in _process_pools:
+            _process_pools[executor] = ProcessPoolExecutor(executor)
+        return _process_pools[executor]
+    return executor
+
+
+def shutdown_dump_executors():
+    """Shut down the worker processes started for `DUMP_EXECUTOR` numbers"""
+    while _process_pools:
+        _process_pools.popitem()[1].shutdown(wait=True)
+
+
+def _encode(indent: Optional[int], js_code_quotes: bool, o: Any) -> str:
+    return OptionsEncoder(indent, js_code_quotes).encode(o)
+
+
+def dump_all(items: Sequence[Tuple[OptionsEncoder, Any]]) -> List[str]:
+    """
+    Encode each `(encoder, options)` pair, concurrently on the executor set in
+    `CurrentConfig.DUMP_EXECUTOR` if any, and return the JSON in order.
+    """
+    executor = _dump_executor()
+    if executor is None or len(items) < 2:
+        return [encoder.encode(o) for encoder, o in items]
+    return list(
+        executor.map(
+            _encode,
+            [encoder.indent for encoder, _ in items],
+            [encoder.js_code_quotes for encoder, _ in items],
+            [o for _, o in items],
+        )
+    )
@@ -15,7 +15,9 @@ class Bar(RectChart):
     def add_yaxis(
         self,
         series_name: str,
-        yaxis_data: types.Sequence[types.Union[types.Numeric, opts.BarItem, dict]],
+        yaxis_data: types.Sequence[
+            types.Union[types.Numeric, opts.BarItem, dict]
+        ] = None,
         *,
         is_selected: bool = True,
         xaxis_index: types.Optional[types.Numeric] = None,
@@ -24,12 +26,18 @@ class Bar(RectChart):
         stack: types.Optional[str] = None,
         category_gap: types.Union[types.Numeric, str] = "20%",
         gap: types.Optional[str] = None,
+        dataset_index: types.Optional[types.Numeric] = None,
+        encode: types.Union[types.JsCode, dict] = None,
         label_opts: types.Label = opts.LabelOpts(),
         markpoint_opts: types.MarkPoint = None,
         markline_opts: types.MarkLine = None,
         tooltip_opts: types.Tooltip = None,
         itemstyle_opts: types.ItemStyle = None,
     ):
+        if yaxis_data is None and encode is None:
+            raise ValueError(
+                "yaxis_data is required unless the series reads a dataset with encode"
+            )
         self._append_color(color)
         self._append_legend(series_name, is_selected)
         self.options.get("series").append(
@@ -39,6 +47,8 @@ class Bar(RectChart):
                 "xAxisIndex": xaxis_index,
                 "yAxisIndex": yaxis_index,
                 "data": yaxis_data,
+                "datasetIndex": dataset_index,
+                "encode": encode,
                 "stack": stack,
                 "barCategoryGap": category_gap,
                 "barGap": gap,
@@ -29,14 +29,17 @@ class BMap(GeoChartBase):
         self._is_ignore_nonexistent_coord = is_ignore_nonexistent_coord
 
     def _feed_data(self, data_pair: types.Sequence, type_: str) -> types.Sequence:
+        # read once, data_pair may be an iterator
+        data_pair = list(data_pair)
         result = []
         type_list = [ChartType.LINES, ChartType.CUSTOM]
         if type_ in type_list:
             result = data_pair
         else:
-            for n, v in data_pair:
+            coordinates, _ = self.get_coordinates(n for n, _ in data_pair)
+            for (n, v), coordinate in zip(data_pair, coordinates):
                 try:
-                    lng, lat = self.get_coordinate(n)
+                    lng, lat = coordinate
                     result.append({"name": n, "value": [lng, lat, v]})
                 except TypeError as err:
                     if self._is_ignore_nonexistent_coord is not True:
@@ -1,6 +1,7 @@
 from ... import options as opts
 from ... import types
 from ...charts.chart import RectChart
+from ...commons import utils
 from ...globals import ChartType
 
 
@@ -41,7 +42,7 @@ class EffectScatter(RectChart):
                 "symbol": symbol,
                 "symbolSize": symbol_size,
                 "symbolRotate": symbol_rotate,
-                "data": [list(z) for z in zip(self._xaxis_data, y_axis)],
+                "data": utils.zip_columns(self._xaxis_data, y_axis),
                 "label": label_opts,
                 "tooltip": tooltip_opts,
                 "itemStyle": itemstyle_opts,
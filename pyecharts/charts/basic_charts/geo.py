@@ -31,8 +31,28 @@ class GeoChartBase(Chart):
         return self
 
     def get_coordinate(self, name: str) -> types.Optional[types.Sequence]:
-        if name in self._coordinates:
-            return self._coordinates[name]
+        return self._coordinates.lookup(name)
+
+    def get_coordinates(
+        self, names: types.Iterable
+    ) -> types.Tuple[types.List[types.Optional[types.Sequence]], types.List[str]]:
+        """
+        Resolve a whole list (or column) of names, every distinct name is
+        looked up only once.
+
+        :return: The coordinates aligned with names (None for unknown names)
+                 and the distinct unknown names.
+        """
+        resolved, misses = {}, []
+        coordinates = []
+        for name in names:
+            if name not in resolved:
+                coordinate = self.get_coordinate(name)
+                if coordinate is None:
+                    misses.append(name)
+                resolved[name] = coordinate
+            coordinates.append(resolved[name])
+        return coordinates, misses
 
     def add(
         self,
@@ -165,15 +185,23 @@ class Geo(GeoChartBase):
         self._is_ignore_nonexistent_coord = is_ignore_nonexistent_coord
 
     def _feed_data(self, data_pair: types.Sequence, type_: str) -> types.Sequence:
+        # read once (data_pair may be an iterator), a bad pair raises here
+        data_pair = [(n, v) for n, v in data_pair]
         result = []
-        for n, v in data_pair:
+        if type_ == ChartType.LINES:
+            coordinates, _ = self.get_coordinates(
+                name for pair in data_pair for name in pair
+            )
+            for i, (n, v) in enumerate(data_pair):
+                f, t = coordinates[2 * i], coordinates[2 * i + 1]
+                result.append({"name": "{}->{}".format(n, v), "coords": [f, t]})
+            return result
+
+        coordinates, _ = self.get_coordinates(n for n, _ in data_pair)
+        for (n, v), coordinate in zip(data_pair, coordinates):
             try:
-                if type_ == ChartType.LINES:
-                    f, t = self.get_coordinate(n), self.get_coordinate(v)
-                    result.append({"name": "{}->{}".format(n, v), "coords": [f, t]})
-                else:
-                    lng, lat = self.get_coordinate(n)
-                    result.append({"name": n, "value": [lng, lat, v]})
+                lng, lat = coordinate
+                result.append({"name": n, "value": [lng, lat, v]})
             except TypeError as err:
                 if self._is_ignore_nonexistent_coord is not True:
                     raise NonexistentCoordinatesException(err, (n, v))
@@ -1,6 +1,7 @@
 from ... import options as opts
 from ... import types
 from ...charts.chart import RectChart
+from ...commons import sampling
 from ...globals import ChartType
 
 
@@ -20,6 +21,10 @@ class Kline(RectChart):
             xaxis_opts=opts.AxisOpts(is_scale=True),
             yaxis_opts=opts.AxisOpts(is_scale=True),
         )
+        # where the candles of the series start in the x axis data given,
+        # None if they are not downsampled
+        self._candle_starts: types.Optional[list] = None
+        self._has_candles: bool = False
 
     def add_yaxis(
         self,
@@ -33,8 +38,26 @@ class Kline(RectChart):
         markpoint_opts: types.MarkPoint = None,
         tooltip_opts: types.Tooltip = None,
         itemstyle_opts: types.ItemStyle = None,
+        downsample_threshold: types.Optional[int] = None,
     ):
+        starts = None
+        if downsample_threshold and len(y_axis) > downsample_threshold:
+            # candles aggregated by bucket, labelled with the first x value
+            # of their bucket
+            starts, y_axis = sampling.ohlc(y_axis, downsample_threshold)
+        if self._has_candles and starts != self._candle_starts:
+            raise ValueError(
+                "The series of a Kline share the x axis, they must have the "
+                "same length and downsample_threshold"
+            )
         self._append_legend(series_name, is_selected)
+        if not self._has_candles:
+            self._has_candles = True
+            self._candle_starts = starts
+            axis = self.options.get("xAxis")[0]
+            if starts is not None and axis.get("data") is not None:
+                axis.update(data=sampling.take(axis.get("data"), starts))
+                self._xaxis_data = axis.get("data")
         self.options.get("series").append(
             {
                 "type": ChartType.KLINE,
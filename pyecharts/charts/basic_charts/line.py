@@ -1,6 +1,7 @@
 from ... import options as opts
 from ... import types
 from ...charts.chart import RectChart
+from ...commons import sampling, utils
 from ...globals import ChartType
 
 
@@ -15,7 +16,7 @@ class Line(RectChart):
     def add_yaxis(
         self,
         series_name: str,
-        y_axis: types.Sequence,
+        y_axis: types.Sequence = None,
         *,
         is_selected: bool = True,
         is_connect_nones: bool = False,
@@ -31,6 +32,10 @@ class Line(RectChart):
         is_hover_animation: bool = True,
         z_level: types.Numeric = 0,
         z: types.Numeric = 0,
+        downsample: types.Optional[str] = None,
+        downsample_threshold: int = 1000,
+        dataset_index: types.Optional[types.Numeric] = None,
+        encode: types.Union[types.JsCode, dict] = None,
         markpoint_opts: types.MarkPoint = None,
         markline_opts: types.MarkLine = None,
         tooltip_opts: types.Tooltip = None,
@@ -39,11 +44,30 @@ class Line(RectChart):
         linestyle_opts: types.LineStyle = opts.LineStyleOpts(),
         areastyle_opts: types.AreaStyle = opts.AreaStyleOpts(),
     ):
+        if y_axis is None and encode is None:
+            raise ValueError(
+                "y_axis is required unless the series reads a dataset with encode"
+            )
         self._append_color(color)
         self._append_legend(series_name, is_selected)
-        # 合并 x 和 y 轴数据，避免当 X 轴的类型设置为 'value' 的时候，
-        # X、Y 轴均显示 Y 轴数据
-        data = [list(z) for z in zip(self._xaxis_data, y_axis)]
+        if encode is not None:
+            # the data is read from the dataset
+            data = y_axis
+        else:
+            # 合并 x 和 y 轴数据，避免当 X 轴的类型设置为 'value' 的时候，
+            # X、Y 轴均显示 Y 轴数据
+            x_data, y_data = self._xaxis_data, y_axis
+            indices = None
+            if downsample:
+                # only downsample_threshold points ("lttb" or "minmax") are sent
+                n = min(len(x_data), len(y_axis))
+                indices = sampling.downsample_indices(
+                    downsample, x_data[:n], y_axis[:n], downsample_threshold
+                )
+                x_data = sampling.take(x_data, indices)
+                y_data = sampling.take(y_axis, indices)
+            self._keep_xaxis_labels(indices)
+            data = utils.zip_columns(x_data, y_data)
 
         self.options.get("series").append(
             {
@@ -59,6 +83,8 @@ class Line(RectChart):
                 "step": is_step,
                 "stack": stack,
                 "data": data,
+                "datasetIndex": dataset_index,
+                "encode": encode,
                 "hoverAnimation": is_hover_animation,
                 "label": label_opts,
                 "lineStyle": linestyle_opts,
@@ -3,6 +3,7 @@ import itertools
 from ... import options as opts
 from ... import types
 from ...charts.chart import RectChart
+from ...commons import sampling, utils
 from ...globals import ChartType
 
 
@@ -19,7 +20,7 @@ class Scatter(RectChart):
     def add_yaxis(
         self,
         series_name: str,
-        y_axis: types.Sequence,
+        y_axis: types.Sequence = None,
         *,
         is_selected: bool = True,
         xaxis_index: types.Optional[types.Numeric] = None,
@@ -28,21 +29,55 @@ class Scatter(RectChart):
         symbol: types.Optional[str] = None,
         symbol_size: types.Union[types.Numeric, types.Sequence] = 10,
         symbol_rotate: types.Optional[types.Numeric] = None,
+        downsample: types.Optional[str] = None,
+        downsample_threshold: int = 1000,
+        dataset_index: types.Optional[types.Numeric] = None,
+        encode: types.Union[types.JsCode, dict] = None,
         label_opts: types.Label = opts.LabelOpts(position="right"),
         markpoint_opts: types.MarkPoint = None,
         markline_opts: types.MarkLine = None,
         tooltip_opts: types.Tooltip = None,
         itemstyle_opts: types.ItemStyle = None,
     ):
+        if y_axis is None and encode is None:
+            raise ValueError(
+                "y_axis is required unless the series reads a dataset with encode"
+            )
         self._append_color(color)
         self._append_legend(series_name, is_selected)
-        if len(y_axis) > 0 and isinstance(y_axis[0], types.Sequence):
-            data = [
-                list(itertools.chain(list([x]), y))
-                for x, y in zip(self._xaxis_data, y_axis)
-            ]
+        if encode is not None:
+            # the data is read from the dataset
+            data = y_axis
         else:
-            data = [list(z) for z in zip(self._xaxis_data, y_axis)]
+            x_data = self._xaxis_data
+            is_multi_dimension = getattr(y_axis, "ndim", 1) > 1
+            is_sequence_items = False
+            if not is_multi_dimension and len(y_axis) > 0:
+                is_sequence_items = isinstance(y_axis[0], types.Sequence)
+            indices = None
+            if downsample:
+                # downsampled on the first y dimension
+                n = min(len(x_data), len(y_axis))
+                if is_multi_dimension:
+                    first = y_axis[:n, 0]
+                elif is_sequence_items:
+                    first = [y[0] for y in y_axis[:n]]
+                else:
+                    first = y_axis[:n]
+                indices = sampling.downsample_indices(
+                    downsample, x_data[:n], first, downsample_threshold
+                )
+                x_data = sampling.take(x_data, indices)
+                y_axis = sampling.take(y_axis, indices)
+            self._keep_xaxis_labels(indices)
+            if is_multi_dimension:
+                data = utils.zip_columns(x_data, *y_axis.T)
+            elif is_sequence_items:
+                data = [
+                    list(itertools.chain(list([x]), y)) for x, y in zip(x_data, y_axis)
+                ]
+            else:
+                data = utils.zip_columns(x_data, y_axis)
         self.options.get("series").append(
             {
                 "type": ChartType.SCATTER,
@@ -53,6 +88,8 @@ class Scatter(RectChart):
                 "symbolSize": symbol_size,
                 "symbolRotate": symbol_rotate,
                 "data": data,
+                "datasetIndex": dataset_index,
+                "encode": encode,
                 "label": label_opts,
                 "markPoint": markpoint_opts,
                 "markLine": markline_opts,
@@ -1,8 +1,27 @@
+import os
+
 from .. import options as opts
 from .. import types
-from ..charts.base import Base
+from ..charts.base import Base, OptionsEncoder
+from ..commons import sampling, utils
 from ..globals import RenderType, ThemeType, ToolTipFormatterType
-from ..types import Optional, Sequence
+from ..types import Optional, Sequence, Union
+
+
+def _to_list(data) -> list:
+    if data is None:
+        return []
+    if utils.is_buffer(data):
+        return data.tolist()
+    return list(data)
+
+
+def _extend_data(item: dict, values: list):
+    data = item.get("data")
+    if isinstance(data, list):
+        data.extend(values)
+    else:
+        item.update(data=_to_list(data) + values)
 
 
 class Chart(Base):
@@ -30,6 +49,29 @@ class Chart(Base):
         self.options.update(color=colors)
         return self
 
+    def append_points(
+        self,
+        series_index: int,
+        points: Sequence,
+        xaxis_data: Optional[Sequence] = None,
+    ) -> str:
+        """
+        Append points to the data of a series (and labels to the data of the
+        first x axis) and return the JSON delta to push to a page rendered
+        with `simple_live_chart.html`, instead of the whole options.
+        """
+        points = _to_list(points)
+        _extend_data(self.options.get("series")[series_index], points)
+        delta = {"seriesIndex": series_index, "data": points}
+        if xaxis_data is not None:
+            xaxis_data = _to_list(xaxis_data)
+            axis = self.options.get("xAxis")[0]
+            _extend_data(axis, xaxis_data)
+            if hasattr(self, "_xaxis_data"):
+                self._xaxis_data = axis.get("data")
+            delta.update(xAxisData=xaxis_data)
+        return OptionsEncoder(indent=None).encode(delta)
+
     def set_series_opts(
         self,
         label_opts: types.Label = None,
@@ -147,6 +189,12 @@ class RectChart(Chart):
     def __init__(self, init_opts: types.Init = opts.InitOpts()):
         super().__init__(init_opts=init_opts)
         self.options.update(xAxis=[opts.AxisOpts().opts], yAxis=[opts.AxisOpts().opts])
+        self._zoom_levels: Optional[str] = None
+        self._zoom_tiles: dict = {}
+        self._zoom_tile_url: Optional[str] = None
+        # positions of the x axis labels used by the downsampled series, None
+        # once a series uses all of them
+        self._xaxis_kept: Optional[set] = set()
 
     def extend_axis(
         self,
@@ -168,6 +216,44 @@ class RectChart(Chart):
     def add_xaxis(self, xaxis_data: Sequence):
         self.options["xAxis"][0].update(data=xaxis_data)
         self._xaxis_data = xaxis_data
+        self._xaxis_kept = set()
+        return self
+
+    def _keep_xaxis_labels(self, indices: Optional[Sequence[int]]):
+        """
+        Keep in the x axis only the labels of the points of the downsampled
+        series (`indices`, None when a series keeps every point), which find
+        their points by label. Labels which are not strings are all kept, as
+        echarts reads numbers as positions on a category axis.
+        """
+        labels = getattr(self, "_xaxis_data", None)
+        if indices is None or self._xaxis_kept is None:
+            if self._xaxis_kept:
+                # trimmed for the series added before
+                self.options["xAxis"][0].update(data=labels)
+            self._xaxis_kept = None
+        elif labels is not None and all(isinstance(v, str) for v in labels):
+            self._xaxis_kept.update(indices)
+            kept = sampling.take(labels, sorted(self._xaxis_kept))
+            self.options["xAxis"][0].update(data=kept)
+
+    def add_dataset(
+        self,
+        source: Union[Sequence, dict],
+        *,
+        dimensions: Optional[Sequence] = None,
+        source_header: Optional[bool] = None,
+    ):
+        """
+        Add a dataset: columns by name (e.g. `{"date": [...], "a": [...]}`) or
+        rows. Series given an `encode` (e.g. `{"x": "date", "y": "a"}`) read
+        their data from it, so a column shared by many series is only
+        serialized once. Only the `add_yaxis` of Bar, Line and Scatter take
+        an `encode`, the series of the other charts need it set in `options`.
+        """
+        self.options.setdefault("dataset", []).append(
+            {"source": source, "dimensions": dimensions, "sourceHeader": source_header}
+        )
         return self
 
     def reversal_axis(self):
@@ -175,6 +261,74 @@ class RectChart(Chart):
         self.options["xAxis"][0]["data"] = None
         return self
 
+    def set_zoom_levels(
+        self,
+        threshold: int = 1000,
+        factor: int = 4,
+        method: str = sampling.LTTB,
+        tile_url: Optional[str] = None,
+        max_tiles: int = 3,
+    ):
+        """
+        Keep `threshold` points ("lttb" or "minmax") of the series having more
+        points than that, and precompute finer levels, each `factor` times
+        finer down to every point, cut in tiles of `threshold` points. When
+        the chart is zoomed with a dataZoom component, the tiles of the finest
+        level covering the window with at most `max_tiles` tiles replace the
+        coarse points of the window.
+
+        The tiles are embedded in the page as json blocks only parsed when
+        needed, or fetched from `{tile_url}/{series}/{level}/{tile}.json` when
+        `tile_url` is given (see `dump_zoom_tiles`). Call it once the series
+        are added; a 'value' or 'time' x axis keeps the page weight bounded.
+        """
+        encoder = OptionsEncoder(indent=None)
+        levels, self._zoom_tiles = [], {}
+        for index, series in enumerate(self.options.get("series")):
+            rows = series.get("data")
+            if isinstance(rows, utils.ColumnarData):
+                rows = rows.rows()
+            if rows is None or len(rows) <= threshold:
+                continue
+            if not all(isinstance(r, (list, tuple)) for r in rows):
+                continue
+            x, y = [r[0] for r in rows], [r[1] for r in rows]
+            indices_by_level = sampling.pyramid(method, x, y, threshold, factor)
+            series.update(data=[rows[i] for i in indices_by_level[0]])
+            tiles_by_level = []
+            for level, indices in enumerate(indices_by_level[1:], 1):
+                tiles = []
+                for start in range(0, len(indices), threshold):
+                    chunk = indices[start:start + threshold]
+                    key = "{}_{}_{}".format(index, level, len(tiles))
+                    self._zoom_tiles[key] = encoder.encode([rows[i] for i in chunk])
+                    tiles.append([chunk[0], chunk[-1]])
+                tiles_by_level.append(tiles)
+            levels.append(
+                {
+                    "index": index,
+                    "count": len(rows),
+                    "base": indices_by_level[0],
+                    "levels": tiles_by_level,
+                }
+            )
+        self._zoom_levels = None
+        if levels:
+            self._zoom_levels = encoder.encode(
+                {"series": levels, "url": tile_url, "maxTiles": max_tiles}
+            )
+        self._zoom_tile_url = tile_url
+        return self
+
+    def dump_zoom_tiles(self, directory: str) -> str:
+        """Write the tiles of `set_zoom_levels` to be served from `tile_url`"""
+        for key, tile in self._zoom_tiles.items():
+            path = os.path.join(directory, *key.split("_")) + ".json"
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(tile)
+        return directory
+
     def overlap(self, chart: Base):
         self.options.get("legend")[0].get("data").extend(
             chart.options.get("legend")[0].get("data")
@@ -2,10 +2,24 @@ import copy
 
 from ... import options as opts
 from ... import types
+from ...commons import utils
 from ...globals import ThemeType
+from ...options.series_options import BasicOpts
 from ..chart import Base, Chart, RectChart
 
 
+def _copy_option(value):
+    """A copy of an option dict, or list of them, sharing what they hold"""
+    if isinstance(value, list):
+        return [v if isinstance(v, list) else _copy_option(v) for v in value]
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, BasicOpts):
+        value = copy.copy(value)
+        value.opts = copy.copy(value.opts)
+    return value
+
+
 class Grid(Base):
     """
     `Gird` Drawing grid in rectangular coordinate. In a single grid,
@@ -28,7 +42,10 @@ class Grid(Base):
         is_control_axis_index: bool = False,
     ):
         if self.options is None:
-            self.options = copy.deepcopy(chart.options)
+            # only the containers updated below are copied, not the data
+            self.options = utils.TrackedDict(
+                (key, _copy_option(value)) for key, value in chart.options.items()
+            )
             self.chart_id = chart.chart_id
             self.options.update(grid=[], title=[])
             if self.theme != ThemeType.WHITE:
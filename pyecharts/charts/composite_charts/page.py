@@ -55,6 +55,9 @@ class Page(CompositeMixin):
         js_host: str = "",
         interval: int = 1,
         layout: types.Union[PageLayoutOpts, dict] = PageLayoutOpts(),
+        is_shared_options: bool = False,
+        is_lazy: bool = False,
+        is_dispose_offscreen: bool = False,
     ):
         self.js_host: str = js_host or CurrentConfig.ONLINE_HOST
         self.page_title = page_title
@@ -63,6 +66,12 @@ class Page(CompositeMixin):
         self.js_functions: utils.OrderedSet = utils.OrderedSet()
         self.js_dependencies = utils.OrderedSet()
         self.download_button: bool = False
+        self.is_shared_options: bool = is_shared_options
+        self.shared_options: str = ""
+        # the charts are only initialized when they come into view, and
+        # disposed when they leave it with `is_dispose_offscreen`
+        self.is_lazy: bool = is_lazy
+        self.is_dispose_offscreen: bool = is_dispose_offscreen
         self._charts: list = []
 
     def add(self, *charts):
@@ -84,9 +93,8 @@ class Page(CompositeMixin):
         return result
 
     def _prepare_render(self):
+        self._dump_options()
         for c in self:
-            if hasattr(c, "dump_options"):
-                c.json_contents = c.dump_options()
             if hasattr(c, "theme"):
                 if c.theme not in ThemeType.BUILTIN_THEMES:
                     self.js_dependencies.add(c.theme)
@@ -134,6 +142,16 @@ class Page(CompositeMixin):
         self._prepare_render()
         return engine.render(self, path, template_name, env, **kwargs)
 
+    def render_stream(
+        self,
+        stream: types.Any,
+        template_name: str = "simple_page.html",
+        env: types.Optional[Environment] = None,
+        **kwargs,
+    ) -> types.Optional[str]:
+        self._prepare_render()
+        return engine.render_stream(self, stream, template_name, env, **kwargs)
+
     def render_embed(
         self,
         template_name: str = "simple_page.html",
@@ -10,10 +10,20 @@ from ..mixins import CompositeMixin
 
 
 class Tab(CompositeMixin):
-    def __init__(self, page_title: str = CurrentConfig.PAGE_TITLE, js_host: str = ""):
+    def __init__(
+        self,
+        page_title: str = CurrentConfig.PAGE_TITLE,
+        js_host: str = "",
+        is_shared_options: bool = False,
+        is_lazy: bool = False,
+    ):
         self.js_host: str = js_host or CurrentConfig.ONLINE_HOST
         self.page_title: str = page_title
         self.download_button: bool = False
+        self.is_shared_options: bool = is_shared_options
+        self.shared_options: str = ""
+        # the charts are only initialized when their tab is first shown
+        self.is_lazy: bool = is_lazy
         self.js_functions: utils.OrderedSet = utils.OrderedSet()
         self.js_dependencies: utils.OrderedSet = utils.OrderedSet()
         self._charts: list = []
@@ -26,9 +36,8 @@ class Tab(CompositeMixin):
         return self
 
     def _prepare_render(self):
+        self._dump_options()
         for c in self:
-            if hasattr(c, "dump_options"):
-                c.json_contents = c.dump_options()
             if hasattr(c, "theme"):
                 if c.theme not in ThemeType.BUILTIN_THEMES:
                     self.js_dependencies.add(c.theme)
@@ -43,6 +52,16 @@ class Tab(CompositeMixin):
         self._prepare_render()
         return engine.render(self, path, template_name, env, **kwargs)
 
+    def render_stream(
+        self,
+        stream: types.Any,
+        template_name: str = "simple_tab.html",
+        env: types.Optional[Environment] = None,
+        **kwargs,
+    ) -> types.Optional[str]:
+        self._prepare_render()
+        return engine.render_stream(self, stream, template_name, env, **kwargs)
+
     def render_embed(
         self,
         template_name: str = "simple_tab.html",
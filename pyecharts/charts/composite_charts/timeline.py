@@ -1,6 +1,26 @@
+import simplejson as json
+
 from ... import options as opts
 from ... import types
+from ...charts.base import dump_all
 from ...charts.chart import Base
+from ...options.series_options import BasicOpts
+
+# kept in the base option even if they differ, to create the components
+_IDENTITY_KEYS = ("type", "id", "name")
+
+
+def _items(value) -> types.Optional[list]:
+    """The dicts of a component given as a dict or a list of dicts"""
+    if isinstance(value, BasicOpts):
+        value = value.opts
+    if isinstance(value, dict):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        items = [v.opts if isinstance(v, BasicOpts) else v for v in value]
+        if all(isinstance(v, dict) for v in items):
+            return items
+    return None
 
 
 class Timeline(Base):
@@ -8,12 +28,104 @@ class Timeline(Base):
     `Timeline` provides functions like switching and playing between multiple charts.
     """
 
-    def __init__(self, init_opts: types.Init = opts.InitOpts()):
+    def __init__(
+        self, init_opts: types.Init = opts.InitOpts(), is_diff_frames: bool = False
+    ):
         super().__init__(init_opts=init_opts)
+        self.is_diff_frames: bool = is_diff_frames
         self.options = {"baseOption": {"series": [], "timeline": {}}, "options": []}
         self.add_schema()
         self._time_points: types.Sequence = []
 
+    def dump_options(self) -> str:
+        if self.is_diff_frames:
+            encoder = self._options_encoder()
+            return encoder.encode(self._diff_frames(encoder))
+        if self.is_cache_json:
+            return super().dump_options()
+        # the base option and each frame are dumped separately, concurrently
+        # when CurrentConfig.DUMP_EXECUTOR is set, then put together
+        encoder = self._options_encoder()
+        frames = self.options.get("options")
+        items = [(encoder, self.options.get("baseOption"))]
+        items.extend((encoder, frame) for frame in frames)
+        dumped = [json.RawJSON(js) for js in dump_all(items)]
+        options = dict(self.options, baseOption=dumped[0], options=dumped[1:])
+        return encoder.encode(options)
+
+    def dump_options_with_quotes(self) -> str:
+        if self.is_diff_frames:
+            encoder = self._options_encoder(js_code_quotes=True)
+            return encoder.encode(self._diff_frames(encoder))
+        return super().dump_options_with_quotes()
+
+    def _diff_frames(self, encoder) -> dict:
+        """
+        The options where what is identical in every frame is only written in
+        the base option. ECharts merges a frame into the option shown before
+        it, which may be any other frame, so a value can only be left out of
+        the frames if none of them changes it. Components given as (lists
+        of) dicts, e.g. the series, are compared key by key, so that only
+        the keys which differ (the data...) are repeated in each frame.
+        """
+        frames = self.options.get("options")
+        base = dict(self.options.get("baseOption"))
+        diffed: list = [{} for _ in frames]
+        keys = list(dict.fromkeys(k for frame in frames for k in frame))
+        for key in keys:
+            values = [frame.get(key) for frame in frames]
+            if any(v is None for v in values):
+                for frame, value in zip(diffed, values):
+                    if value is not None:
+                        frame[key] = json.RawJSON(encoder.encode(value))
+                continue
+            items = [_items(v) for v in values]
+            first = values[0].opts if isinstance(values[0], BasicOpts) else values[0]
+            is_list = not isinstance(first, dict)
+            if any(i is None or len(i) != len(items[0]) for i in items):
+                encoded = [encoder.encode(v) for v in values]
+                if len(set(encoded)) == 1:
+                    base[key] = json.RawJSON(encoded[0])
+                    continue
+                for frame, js in zip(diffed, encoded):
+                    frame[key] = json.RawJSON(js)
+                continue
+
+            # the frames missing a key keep the value of the base option
+            base_value = base.get(key)
+            original = None if base_value is None else _items(base_value)
+            if original is not None and len(original) != len(items[0]):
+                original = None
+            base_items, frame_items = [], [[] for _ in frames]
+            for index in range(len(items[0])):
+                column = [i[index] for i in items]
+                shared, changed = {}, [{} for _ in frames]
+                item_keys = dict.fromkeys(k for item in column for k in item)
+                for item_key in item_keys:
+                    encoded = [
+                        None if item.get(item_key) is None
+                        else encoder.encode(item.get(item_key))
+                        for item in column
+                    ]
+                    if None not in encoded and len(set(encoded)) == 1:
+                        shared[item_key] = json.RawJSON(encoded[0])
+                        continue
+                    for item, js in zip(changed, encoded):
+                        if js is not None:
+                            item[item_key] = json.RawJSON(js)
+                    if item_key in _IDENTITY_KEYS and encoded[0] is not None:
+                        shared[item_key] = json.RawJSON(encoded[0])
+                    elif None in encoded and original is not None:
+                        shared[item_key] = original[index].get(item_key)
+                base_items.append(shared)
+                for frame, item in zip(frame_items, changed):
+                    frame.append(item)
+            base[key] = base_items if is_list else base_items[0]
+            if any(item for frame in frame_items for item in frame):
+                for frame, frame_item in zip(diffed, frame_items):
+                    frame[key] = frame_item if is_list else frame_item[0]
+        return dict(self.options, baseOption=base, options=diffed)
+
     def add_schema(
         self,
         axis_type: str = "category",
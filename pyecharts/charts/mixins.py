@@ -1,3 +1,9 @@
+import collections
+import uuid
+
+import simplejson as json
+
+from ..commons import utils
 from ..render import engine
 
 
@@ -18,3 +24,70 @@ class CompositeMixin(ChartMixin):
 
     def __len__(self):
         return len(self._charts)
+
+    def _dump_options(self):
+        """
+        Dump the options of every chart into its `json_contents`.
+
+        With `is_shared_options`, the top-level options (series apart) which
+        are identical in several charts, e.g. the default color list, are
+        dumped once into the `shared_options` script and the charts refer
+        to them instead of embedding their own copy.
+        """
+        from .base import Base, dump_all
+
+        self.shared_options = ""
+        charts = []
+        for c in self:
+            if not hasattr(c, "dump_options"):
+                continue
+            if type(c).dump_options is not Base.dump_options:
+                # dumped its own way, e.g. the diffed frames of a Timeline
+                c.json_contents = c.dump_options()
+            else:
+                charts.append(c)
+        if not self.is_shared_options:
+            items = []
+            for c in charts:
+                encoder = c._options_encoder()
+                items.append((encoder, c._options_to_dump(encoder)))
+            dumped = dump_all(items)
+            for c, json_contents in zip(charts, dumped):
+                c.json_contents = json_contents
+            return
+
+        dumped, counts = [], collections.Counter()
+        for c in charts:
+            encoder = c._options_encoder()
+            options = dict(c._options_to_dump(encoder))
+            subtrees = {}
+            for key, value in options.items():
+                if key == "series" or value is None:
+                    continue
+                if isinstance(value, str) and not value:
+                    continue
+                if isinstance(value, json.RawJSON):
+                    # cached, already encoded for the first level
+                    js = encoder._dedent(value.encoded_json, 1)
+                else:
+                    js = encoder.encode(value)
+                subtrees[key] = js
+                # written as it is, in the chart or in the shared options
+                options[key] = json.RawJSON(js)
+            dumped.append((encoder, options, subtrees))
+            counts.update(subtrees.items())
+
+        name = "shared_options_{}".format(uuid.uuid4().hex)
+        shared: dict = {}
+        items = []
+        for encoder, options, subtrees in dumped:
+            for key, js in subtrees.items():
+                ref = "{}[{}]".format(name, shared.get(js, len(shared)))
+                if counts[(key, js)] > 1 and len(ref) < len(js):
+                    shared.setdefault(js, len(shared))
+                    options[key] = utils.JsCode(ref)
+            items.append((encoder, options))
+        for c, json_contents in zip(charts, dump_all(items)):
+            c.json_contents = json_contents
+        if shared:
+            self.shared_options = "var {} = [{}];".format(name, ", ".join(shared))
@@ -0,0 +1,201 @@
+"""
+Server-side downsampling of series data, so that only `threshold` points are
+serialized and sent to the browser. The computations are vectorized with
+numpy when it is installed and fall back to plain Python otherwise.
+"""
+from ..types import List, Sequence, Tuple
+
+LTTB = "lttb"
+MIN_MAX = "minmax"
+
+
+def _numpy():
+    try:
+        import numpy
+
+        return numpy
+    except ImportError:
+        return None
+
+
+def _floats(values: Sequence, np=None):
+    """
+    Values as floats (a numpy array if np is given), None becoming NaN, or
+    None if they are not numbers.
+    """
+    try:
+        if np is not None:
+            return np.asarray(values, dtype=float)
+        return [float("nan") if v is None else float(v) for v in values]
+    except (TypeError, ValueError):
+        return None
+
+
+def _bucket_edges(n: int, buckets: int) -> List[int]:
+    return [n * i // buckets for i in range(buckets + 1)]
+
+
+def lttb(x: Sequence, y: Sequence, threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets: the indices of the `threshold` points that
+    keep the visual shape of the line best. `x` values which are not numbers
+    (e.g. category labels) are replaced by their positions.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    np = _numpy()
+    xs = _floats(x, np) if x is not None else None
+    if xs is None or len(xs) != n:
+        xs = _floats(range(n), np)
+    ys = _floats(y, np)
+    if ys is None:
+        raise TypeError("lttb needs numeric y values")
+
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    if np is not None:
+        for i in range(threshold - 2):
+            start, end = int(i * every) + 1, int((i + 1) * every) + 1
+            next_end = min(int((i + 2) * every) + 1, n)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                next_y = ys[end:next_end]
+                next_y = next_y[~np.isnan(next_y)]
+                avg_y = next_y.mean() if len(next_y) else ys[a]
+                avg_x = xs[end:next_end].mean()
+                rise = (xs[a] - avg_x) * (ys[start:end] - ys[a])
+                area = np.abs(rise - (xs[a] - xs[start:end]) * (avg_y - ys[a]))
+            area[np.isnan(area)] = -1
+            a = start + int(area.argmax())
+            selected.append(a)
+    else:
+        for i in range(threshold - 2):
+            start, end = int(i * every) + 1, int((i + 1) * every) + 1
+            next_end = min(int((i + 2) * every) + 1, n)
+            next_y = [v for v in ys[end:next_end] if v == v]
+            avg_y = sum(next_y) / len(next_y) if next_y else ys[a]
+            avg_x = sum(xs[end:next_end]) / (next_end - end)
+            best, best_area = start, -1.0
+            for c in range(start, end):
+                rise = (xs[a] - avg_x) * (ys[c] - ys[a])
+                area = abs(rise - (xs[a] - xs[c]) * (avg_y - ys[a]))
+                if area > best_area:
+                    best, best_area = c, area
+            a = best
+            selected.append(a)
+    selected.append(n - 1)
+    return selected
+
+
+def min_max(y: Sequence, threshold: int) -> List[int]:
+    """
+    The indices of the minimum and the maximum of `threshold // 2` buckets, in
+    order, so that no peak is lost.
+    """
+    n = len(y)
+    buckets = threshold // 2
+    if threshold >= n or buckets < 1:
+        return list(range(n))
+    np = _numpy()
+    ys = _floats(y, np)
+    if ys is None:
+        raise TypeError("min-max sampling needs numeric y values")
+
+    edges = _bucket_edges(n, buckets)
+    selected: List[int] = []
+    if np is not None:
+        filled_low = np.where(np.isnan(ys), np.inf, ys)
+        filled_high = np.where(np.isnan(ys), -np.inf, ys)
+        for start, end in zip(edges, edges[1:]):
+            low = start + int(filled_low[start:end].argmin())
+            high = start + int(filled_high[start:end].argmax())
+            selected.extend(sorted({low, high}))
+    else:
+        for start, end in zip(edges, edges[1:]):
+            values = [(v, i) for i, v in enumerate(ys[start:end], start) if v == v]
+            if not values:
+                selected.append(start)
+                continue
+            # the first one of equal values, as numpy does
+            low = min(values, key=lambda value: value[0])[1]
+            high = max(values, key=lambda value: value[0])[1]
+            selected.extend(sorted({low, high}))
+    return selected
+
+
+def ohlc(data: Sequence, threshold: int) -> Tuple[List[int], list]:
+    """
+    Aggregate candlestick rows (`[open, close, lowest, highest]`) into
+    `threshold` buckets: the first open, the last close, the lowest low and
+    the highest high of each bucket.
+
+    :return: The index where each bucket starts and the aggregated rows.
+    """
+    n = len(data)
+    if threshold >= n or threshold < 1:
+        return list(range(n)), [list(row) for row in data]
+    starts = _bucket_edges(n, threshold)[:-1]
+
+    np = _numpy()
+    if np is not None:
+        rows = np.asarray(data, dtype=float)
+        starts_array = np.asarray(starts)
+        ends = np.append(starts_array[1:], n) - 1
+        aggregated = np.column_stack(
+            (
+                rows[starts_array, 0],
+                rows[ends, 1],
+                np.fmin.reduceat(rows[:, 2], starts_array),
+                np.fmax.reduceat(rows[:, 3], starts_array),
+            )
+        )
+        return starts, aggregated.tolist()
+
+    aggregated = []
+    for start, end in zip(starts, starts[1:] + [n]):
+        bucket = data[start:end]
+        lows = [row[2] for row in bucket if row[2] is not None]
+        highs = [row[3] for row in bucket if row[3] is not None]
+        aggregated.append(
+            [
+                bucket[0][0],
+                bucket[-1][1],
+                min(lows) if lows else None,
+                max(highs) if highs else None,
+            ]
+        )
+    return starts, aggregated
+
+
+def take(values: Sequence, indices: List[int]):
+    """The values at indices, a numpy array staying an array"""
+    if hasattr(values, "dtype") and hasattr(values, "take"):
+        return values.take(indices, axis=0)
+    return [values[i] for i in indices]
+
+
+def downsample_indices(
+    method: str, x: Sequence, y: Sequence, threshold: int
+) -> List[int]:
+    if method == LTTB:
+        return lttb(x, y, threshold)
+    if method == MIN_MAX:
+        return min_max(y, threshold)
+    raise ValueError("Unknown downsample method '{}'".format(method))
+
+
+def pyramid(
+    method: str, x: Sequence, y: Sequence, threshold: int, factor: int = 4
+) -> List[List[int]]:
+    """
+    The indices of each level of a resolution pyramid, from `threshold` points
+    to every point, each level being `factor` times finer than the previous.
+    """
+    n = len(y)
+    levels, size = [], threshold
+    while size < n:
+        levels.append(downsample_indices(method, x, y, size))
+        size *= factor
+    levels.append(list(range(n)))
+    return levels
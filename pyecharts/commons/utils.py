@@ -1,6 +1,10 @@
+import array
+import base64
+import itertools
 import re
+import sys
 
-from ..datasets import EXTRA, FILENAMES
+from ..datasets import resolve_js_dependency
 
 
 class JsCode:
@@ -26,23 +30,204 @@ class OrderedSet:
                 self.items.append(item)
 
 
+class TrackedDict(dict):
+    """
+    A dict keeping a version number per key, bumped whenever the key is
+    written, deleted or its value handed out through `[]`, `get`, `setdefault`
+    or `pop` (the value may then be modified in place). Iterating with `items`
+    or `values` is not tracked.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.versions: dict = {}
+        self.update(*args, **kwargs)
+
+    def touch(self, *keys):
+        versions = self.__dict__.setdefault("versions", {})
+        for key in keys:
+            versions[key] = versions.get(key, 0) + 1
+
+    def __getitem__(self, key):
+        self.touch(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.touch(key)
+        return super().get(key, default)
+
+    def __setitem__(self, key, value):
+        self.touch(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.touch(key)
+        super().__delitem__(key)
+
+    def setdefault(self, key, default=None):
+        self.touch(key)
+        return super().setdefault(key, default)
+
+    def pop(self, key, *args):
+        self.touch(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self.touch(key)
+        return key, value
+
+    def update(self, *args, **kwargs):
+        other = dict(*args, **kwargs)
+        self.touch(*other)
+        super().update(other)
+
+    def clear(self):
+        self.touch(*self)
+        super().clear()
+
+
+class ColumnarData:
+    """
+    Rows zipped from several columns (numpy arrays, array.array, lists...).
+    The columns are kept as they are and only turned into rows when the
+    options are serialized, so no Python list is allocated per data point.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, *columns):
+        self.columns = columns
+
+    def __len__(self):
+        return min(len(c) for c in self.columns)
+
+    def __getitem__(self, index: int):
+        return [c[index] for c in self.columns]
+
+    def __iter__(self):
+        for row in zip(*self.columns):
+            yield list(row)
+
+    def rows(self):
+        columns = [c.tolist() if is_buffer(c) else c for c in self.columns]
+        return list(zip(*columns))
+
+
+def is_buffer(data) -> bool:
+    """numpy arrays / pandas series, array.array and memoryview"""
+    if isinstance(data, (array.array, memoryview)):
+        return True
+    return hasattr(data, "dtype") and hasattr(data, "tolist")
+
+
+def is_numeric_buffer(data) -> bool:
+    if isinstance(data, array.array):
+        return data.typecode != "u"
+    if isinstance(data, memoryview):
+        return data.format in tuple("bBhHiIlLqQnNfd?")
+    return is_buffer(data) and getattr(data.dtype, "kind", None) in ("b", "i", "u", "f")
+
+
+def _is_float32(data) -> bool:
+    if isinstance(data, array.array):
+        return data.typecode == "f"
+    if isinstance(data, memoryview):
+        return data.format == "f"
+    dtype = data.dtype
+    return dtype.kind == "f" and dtype.itemsize == 4
+
+
+# rebuilds the typed arrays of `TypedArray` in the browser
+TYPED_ARRAY_DECODER = (
+    "function pyecharts_typed_array(type, data) {"
+    " var bytes = atob(data), buffer = new Uint8Array(bytes.length);"
+    " for (var i = 0; i < bytes.length; i++) { buffer[i] = bytes.charCodeAt(i); }"
+    " return new window[type](buffer.buffer); }"
+)
+
+
+# values of a data item for the series types whose data echarts also reads
+# from a flat typed array
+TYPED_ARRAY_DIMENSIONS = {"scatter": 2, "effectScatter": 2, "scatter3D": 3, "lines": 4}
+
+
+def _numeric_columns(data):
+    if isinstance(data, ColumnarData):
+        if all(map(is_numeric_buffer, data.columns)):
+            n = len(data)
+            return [c[:n] for c in data.columns]
+    elif is_numeric_buffer(data) and getattr(data, "ndim", 1) == 2:
+        return [data[:, i] for i in range(data.shape[1])]
+    return None
+
+
+class TypedArray:
+    """
+    Numeric series data sent as a base64 Float32Array (float32 columns) or
+    Float64Array holding the rows one after the other, which the browser
+    decodes much faster than the same numbers written as JSON text. The
+    lines are each prefixed with their number of points (2).
+    """
+
+    __slots__ = ("data", "series_type")
+
+    def __init__(self, data, series_type: str = "scatter"):
+        self.data = data
+        self.series_type = series_type
+
+    @staticmethod
+    def accepts(data, series_type: str = "scatter") -> bool:
+        dimensions = TYPED_ARRAY_DIMENSIONS.get(series_type)
+        columns = _numeric_columns(data) if dimensions else None
+        return columns is not None and len(columns) == dimensions
+
+    def to_js(self) -> JsCode:
+        columns = _numeric_columns(self.data)
+        is_float32 = all(map(_is_float32, columns))
+        n = len(columns[0])
+        if all(hasattr(c, "dtype") for c in columns):
+            import numpy
+
+            dtype = "<f4" if is_float32 else "<f8"
+            values = [numpy.asarray(c, dtype=dtype) for c in columns]
+            if self.series_type == "lines":
+                values.insert(0, numpy.full(n, 2, dtype=dtype))
+            raw = numpy.column_stack(values).tobytes()
+        else:
+            lists = [c.tolist() for c in columns]
+            if self.series_type == "lines":
+                lists.insert(0, [2] * n)
+            values = array.array("f" if is_float32 else "d")
+            values.extend(itertools.chain.from_iterable(zip(*lists)))
+            if sys.byteorder == "big":
+                values.byteswap()
+            raw = values.tobytes()
+        return JsCode(
+            "pyecharts_typed_array('{}', '{}')".format(
+                "Float32Array" if is_float32 else "Float64Array",
+                base64.b64encode(raw).decode(),
+            )
+        )
+
+
+def zip_columns(*columns):
+    if any(is_buffer(c) for c in columns):
+        return ColumnarData(*columns)
+    return [list(z) for z in zip(*columns)]
+
+
 def produce_require_dict(js_dependencies, js_host) -> dict:
     confs, libraries = [], []
     for name in js_dependencies.items:
         if name.startswith("https://api.map.baidu.com"):
             confs.append("'baidu_map_api{}':'{}'".format(len(name), name))
             libraries.append("'baidu_map_api{}'".format(len(name)))
-        if name in FILENAMES:
-            f, _ = FILENAMES[name]
-            confs.append("'{}':'{}{}'".format(name, js_host, f))
+        resolved = resolve_js_dependency(name, js_host)
+        if resolved:
+            url, f, _ = resolved
+            confs.append("'{}':'{}{}'".format(name, url, f))
             libraries.append("'{}'".format(name))
-        else:
-            for url, files in EXTRA.items():
-                if name in files:
-                    f, _ = files[name]
-                    confs.append("'{}':'{}{}'".format(name, url, f))
-                    libraries.append("'{}'".format(name))
-                    break
     return dict(config_items=confs, libraries=libraries)
 
 
@@ -54,6 +239,31 @@ def replace_placeholder_with_quotes(html: str) -> str:
     return re.sub("--x_x--0_0--", "", html)
 
 
+_PLACEHOLDER_PATTERN = re.compile('"?--x_x--0_0--"?')
+
+
+def iter_replace_placeholder(chunks):
+    """
+    Incremental `replace_placeholder` over an iterable of html chunks, a tail
+    which may hold an unfinished placeholder is kept until the next chunk.
+    """
+    pending = ""
+    for chunk in chunks:
+        html = pending + chunk
+        cut = len(html) - len("--x_x--0_0--") - 1
+        for m in _PLACEHOLDER_PATTERN.finditer(html):
+            if m.end() > cut:
+                cut = m.start()
+                break
+        if cut <= 0:
+            pending = html
+            continue
+        pending = html[cut:]
+        yield _PLACEHOLDER_PATTERN.sub("", html[:cut])
+    if pending:
+        yield _PLACEHOLDER_PATTERN.sub("", pending)
+
+
 def _flat(obj):
     if hasattr(obj, "js_dependencies"):
         return list(obj.js_dependencies)
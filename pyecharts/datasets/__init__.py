@@ -1,3 +1,4 @@
+import collections
 import difflib
 import os
 import typing
@@ -7,7 +8,14 @@ import simplejson as json
 
 
 class FuzzyDict(dict):
-    """Provides a dictionary that performs fuzzy lookup"""
+    """Provides a dictionary that performs fuzzy lookup
+
+    Fuzzy lookups only compare the keys sharing at least one character with
+    the looked up key (found via a character index built lazily), and skip
+    every key whose character overlap cannot beat the best ratio so far.
+    Results are cached until the dictionary is modified."""
+
+    _CACHE_SIZE = 10000
 
     def __init__(self, cutoff: float = 0.6):
         """Construct a new FuzzyDict instance
@@ -23,6 +31,66 @@ class FuzzyDict(dict):
         self._dict_contains = lambda key: super(FuzzyDict, self).__contains__(key)
         self._dict_getitem = lambda key: super(FuzzyDict, self).__getitem__(key)
 
+        # [(key, Counter of its characters)] and {character: [positions]}
+        self._indexed_keys: list = []
+        self._index: typing.Optional[dict] = None
+        self._cache: dict = {}
+        # called whenever the dictionary is modified
+        self._on_change: typing.Optional[typing.Callable[[], None]] = None
+
+    def _invalidate(self):
+        self._index = None
+        self._cache.clear()
+        if self._on_change is not None:
+            self._on_change()
+
+    def __setitem__(self, key: typing.Any, value: typing.Any):
+        super(FuzzyDict, self).__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key: typing.Any):
+        super(FuzzyDict, self).__delitem__(key)
+        self._invalidate()
+
+    def update(self, *args, **kwargs):
+        super(FuzzyDict, self).update(*args, **kwargs)
+        self._invalidate()
+
+    def setdefault(self, key: typing.Any, default: typing.Any = None):
+        self._invalidate()
+        return super(FuzzyDict, self).setdefault(key, default)
+
+    def pop(self, *args):
+        self._invalidate()
+        return super(FuzzyDict, self).pop(*args)
+
+    def popitem(self):
+        self._invalidate()
+        return super(FuzzyDict, self).popitem()
+
+    def clear(self):
+        super(FuzzyDict, self).clear()
+        self._invalidate()
+
+    def _build_index(self):
+        self._indexed_keys = []
+        self._index = {}
+        for key in self:
+            if not isinstance(key, str):
+                continue
+            for char in set(key):
+                self._index.setdefault(char, []).append(len(self._indexed_keys))
+            self._indexed_keys.append((key, collections.Counter(key)))
+
+    def _candidates(self, lookfor: str):
+        if self._index is None:
+            self._build_index()
+        positions = set()
+        for char in set(lookfor):
+            positions.update(self._index.get(char, ()))
+        # keep the order of the dictionary, the first best match wins
+        return [self._indexed_keys[p] for p in sorted(positions)]
+
     def _search(self, lookfor: typing.Any, stop_on_first: bool = False):
         """Returns the value whose key best matches lookfor
 
@@ -34,31 +102,36 @@ class FuzzyDict(dict):
         if self._dict_contains(lookfor):
             return True, lookfor, self._dict_getitem(lookfor), 1
 
+        # only strings can be fuzzy matched
+        if not isinstance(lookfor, str):
+            return False, None, None, 0
+
+        cache_key = (lookfor, stop_on_first, self.cutoff)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
         # set up the fuzzy matching tool
         ratio_calc = difflib.SequenceMatcher()
         ratio_calc.set_seq1(lookfor)
+        lookfor_chars = collections.Counter(lookfor)
 
-        # test each key in the dictionary
+        # test each key sharing characters with lookfor
         best_ratio = 0
         best_match = None
         best_key = None
-        for key in self:
-            # if the current key is not a string
-            # then we just skip it
-            try:
-                # set up the SequenceMatcher with other text
-                ratio_calc.set_seq2(key)
-            except TypeError:
+        for key, key_chars in self._candidates(lookfor):
+            # upper bound of the ratio: the matching characters can not
+            # outnumber the characters both strings have in common
+            common = sum((lookfor_chars & key_chars).values())
+            upper_bound = 2.0 * common / (len(lookfor) + len(key))
+            if upper_bound <= best_ratio or (
+                stop_on_first and upper_bound < self.cutoff
+            ):
                 continue
 
-            # we get an error here if the item to look for is not a
-            # string - if it cannot be fuzzy matched and we are here
-            # this it is definitely not in the dictionary
-            try:
-                # calculate the match value
-                ratio = ratio_calc.ratio()
-            except TypeError:
-                break
+            # set up the SequenceMatcher with other text
+            ratio_calc.set_seq2(key)
+            ratio = ratio_calc.ratio()
 
             # if this is the best ratio so far - save it and the value
             if ratio > best_ratio:
@@ -69,7 +142,17 @@ class FuzzyDict(dict):
             if stop_on_first and ratio >= self.cutoff:
                 break
 
-        return best_ratio >= self.cutoff, best_key, best_match, best_ratio
+        result = best_ratio >= self.cutoff, best_key, best_match, best_ratio
+        if len(self._cache) >= self._CACHE_SIZE:
+            self._cache.clear()
+        self._cache[cache_key] = result
+        return result
+
+    def lookup(self, lookfor: typing.Any, default: typing.Any = None):
+        """Fuzzy counterpart of `get`: a single search where `in` followed by
+        `[]` would search twice. Returns default if nothing matches."""
+        matched, _, item, _ = self._search(lookfor)
+        return item if matched else default
 
     def __contains__(self, item: typing.Any):
         if self._search(item, True)[0]:
@@ -89,19 +172,85 @@ class FuzzyDict(dict):
         return item
 
 
-__HERE = os.path.abspath(os.path.dirname(__file__))
-with open(os.path.join(__HERE, "map_filename.json"), "r", encoding="utf8") as f:
-    FILENAMES: FuzzyDict = FuzzyDict()
-    for k, v in json.load(f).items():
-        FILENAMES[k] = v
+class _LazyFuzzyDict(FuzzyDict):
+    """FuzzyDict filled from a bundled json file the first time it is used"""
+
+    def __init__(self, file_name: str, cutoff: float = 0.6):
+        super(_LazyFuzzyDict, self).__init__(cutoff)
+        self._file_name = file_name
+        self._loaded = False
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        with open(self._file_name, "r", encoding="utf8") as f:
+            super(_LazyFuzzyDict, self).update(json.load(f))
+
+
+def _loading(name: str):
+    def method(self, *args, **kwargs):
+        self._load()
+        return getattr(super(_LazyFuzzyDict, self), name)(*args, **kwargs)
 
-with open(os.path.join(__HERE, "city_coordinates.json"), "r", encoding="utf8") as f:
-    COORDINATES: FuzzyDict = FuzzyDict()
-    for k, v in json.load(f).items():
-        COORDINATES[k] = v
+    method.__name__ = name
+    return method
+
+
+for _name in (
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__getitem__",
+    "__iter__",
+    "__len__",
+    "__ne__",
+    "__repr__",
+    "__setitem__",
+    "_search",
+    "clear",
+    "copy",
+    "get",
+    "items",
+    "keys",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+    "values",
+):
+    setattr(_LazyFuzzyDict, _name, _loading(_name))
+
+__HERE = os.path.abspath(os.path.dirname(__file__))
+FILENAMES: FuzzyDict = _LazyFuzzyDict(os.path.join(__HERE, "map_filename.json"))
+COORDINATES: FuzzyDict = _LazyFuzzyDict(os.path.join(__HERE, "city_coordinates.json"))
 
 EXTRA = {}
 
+# dependency -> [file name, extension] found in FILENAMES or None, cleared
+# whenever FILENAMES is modified
+_RESOLVED_DEPENDENCIES: dict = {}
+FILENAMES._on_change = _RESOLVED_DEPENDENCIES.clear
+
+
+def resolve_js_dependency(
+    name: str, js_host: str
+) -> typing.Optional[typing.Tuple[str, str, str]]:
+    """Url prefix, file name and extension of a js dependency found in FILENAMES
+    (served from js_host) or in one of the EXTRA registries, None otherwise.
+
+    The fuzzy lookups in FILENAMES are memoized until FILENAMES is modified,
+    EXTRA is searched on every call."""
+    if name not in _RESOLVED_DEPENDENCIES:
+        _RESOLVED_DEPENDENCIES[name] = FILENAMES.lookup(name)
+    file_name = _RESOLVED_DEPENDENCIES[name]
+    if file_name is not None:
+        return js_host, file_name[0], file_name[1]
+    for url, files in EXTRA.items():
+        if name in files:
+            return url, files[name][0], files[name][1]
+    return None
+
 
 def register_url(asset_url: str):
     if asset_url:
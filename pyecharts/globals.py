@@ -141,6 +141,14 @@ class _CurrentConfig:
     PAGE_TITLE = "Awesome-pyecharts"
     ONLINE_HOST = OnlineHostType.DEFAULT_HOST
     NOTEBOOK_TYPE = NotebookType.JUPYTER_NOTEBOOK
+    # dump chart options without indentation and whitespace
+    COMPACT_JSON = False
+    # dump the options of the charts of a Page, Tab or Timeline concurrently:
+    # a number of worker processes or any concurrent.futures.Executor, None
+    # dumps them one after another. Worker processes may have to import the
+    # calling script, guard it with `if __name__ == "__main__":`. They are kept
+    # until `pyecharts.charts.base.shutdown_dump_executors()`
+    DUMP_EXECUTOR = None
     GLOBAL_ENV = Environment(
         keep_trailing_newline=True,
         trim_blocks=True,
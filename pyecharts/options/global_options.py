@@ -51,6 +51,11 @@ class InitOpts(BasicOpts):
         bg_color: Union[str, dict] = None,
         js_host: str = "",
         animation_opts: Union[AnimationOpts, dict] = AnimationOpts(),
+        is_compact_json: Optional[bool] = None,
+        # options changed through references taken before a dump (e.g. the
+        # series list kept in a variable) are not seen by the cache
+        is_cache_json: Optional[bool] = None,
+        is_typed_array: Optional[bool] = None,
     ):
         self.opts: dict = {
             "width": width,
@@ -62,6 +67,9 @@ class InitOpts(BasicOpts):
             "bg_color": bg_color,
             "js_host": js_host,
             "animationOpts": animation_opts,
+            "is_compact_json": is_compact_json,
+            "is_cache_json": is_cache_json,
+            "is_typed_array": is_typed_array,
         }
 
 
@@ -1 +1,7 @@
-from .snapshot import make_snapshot
+from .live import LiveServer
+from .snapshot import (
+    SnapshotPool,
+    WebDriverEngine,
+    make_snapshot,
+    make_snapshot_in_memory,
+)
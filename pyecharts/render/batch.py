@@ -0,0 +1,188 @@
+"""
+Render many charts from JSON specs over a process pool:
+
+    python -m pyecharts.render.batch specs.jsonl output_dir --processes 8
+
+A spec is a JSON object with the `options` of the chart and optionally its
+`init_opts` (the arguments of `InitOpts`), extra `js_dependencies` (e.g. map
+names) and the `path` of the html file, relative to the output directory.
+"""
+import argparse
+import collections
+import glob
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ..charts.base import Base
+from ..commons import utils
+from ..globals import CurrentConfig
+from ..options import InitOpts
+from ..types import Any, Iterator, List, Optional, Tuple
+
+_Task = Tuple[str, Optional[str], Optional[str]]
+
+
+def _read_tasks(source: str) -> Iterator[_Task]:
+    """(name, path, line) of the specs of a directory or of a JSON lines file"""
+    if os.path.isdir(source):
+        for path in sorted(glob.glob(os.path.join(source, "*.json"))):
+            yield os.path.splitext(os.path.basename(path))[0], path, None
+        return
+    if source == "-":
+        # stdin is not ours to close
+        yield from _read_lines(sys.stdin)
+        return
+    with open(source, encoding="utf-8") as f:
+        yield from _read_lines(f)
+
+
+def _read_lines(f) -> Iterator[_Task]:
+    for index, line in enumerate(f):
+        if line.strip():
+            yield "{:06d}".format(index), None, line
+
+
+def render_spec(
+    spec: dict, path: str, template_name: str = "simple_chart.html"
+) -> int:
+    """Render a chart spec into `path` and return the size of the file"""
+    chart = Base(InitOpts(**spec.get("init_opts", {})))
+    chart.options = utils.TrackedDict(spec["options"])
+    chart.js_dependencies.add(*spec.get("js_dependencies", ()))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        chart.render_stream(f, template_name)
+    return os.path.getsize(path)
+
+
+def _init_worker(template_name: str):
+    # every chart of the worker is rendered with this compiled template
+    CurrentConfig.GLOBAL_ENV.get_template(template_name)
+
+
+def _render_tasks(
+    output_dir: str, template_name: str, tasks: List[_Task]
+) -> List[Tuple[str, int, Optional[str]]]:
+    results = []
+    for name, path, line in tasks:
+        try:
+            if path is not None:
+                with open(path, encoding="utf-8") as f:
+                    line = f.read()
+            spec = json.loads(line)
+            output = os.path.join(output_dir, spec.get("path") or name + ".html")
+            results.append((output, render_spec(spec, output, template_name), None))
+        except Exception as e:
+            results.append((name, 0, "{}: {}".format(type(e).__name__, e)))
+    return results
+
+
+def render_batch(
+    source: str,
+    output_dir: str,
+    *,
+    processes: Optional[int] = None,
+    chunk_size: int = 32,
+    template_name: str = "simple_chart.html",
+    interval: float = 2.0,
+    log: Any = sys.stderr,
+) -> dict:
+    """
+    Render the chart specs of `source` (a directory of .json files, a JSON
+    lines file or "-" for stdin) into html files of `output_dir`.
+
+    The specs are read as they are rendered, by chunks of `chunk_size` sent
+    to `processes` workers which each compile the template once. Failed
+    specs, and every `interval` seconds the progress, are written to `log`.
+
+    :return: The number of `rendered` and `failed` charts, the `bytes`
+             written and the `seconds` it took.
+    """
+    processes = processes or os.cpu_count() or 1
+    tasks = _read_tasks(source)
+    chunks = iter(lambda: list(itertools.islice(tasks, chunk_size)), [])
+    stats = {"rendered": 0, "failed": 0, "bytes": 0, "seconds": 0.0}
+    start = reported = time.perf_counter()
+
+    def collect(results):
+        nonlocal reported
+        for output, size, error in results:
+            if error is None:
+                stats["rendered"] += 1
+                stats["bytes"] += size
+            else:
+                stats["failed"] += 1
+                if log is not None:
+                    log.write("failed {}: {}\n".format(output, error))
+        stats["seconds"] = time.perf_counter() - start
+        if log is not None and time.perf_counter() - reported >= interval:
+            reported = time.perf_counter()
+            log.write(_format_stats(stats) + "\n")
+
+    with ProcessPoolExecutor(
+        processes, initializer=_init_worker, initargs=(template_name,)
+    ) as executor:
+        # a bounded number of chunks in flight, the specs are not all loaded
+        pending: collections.deque = collections.deque()
+        for chunk in chunks:
+            pending.append(
+                executor.submit(_render_tasks, output_dir, template_name, chunk)
+            )
+            if len(pending) >= 2 * processes:
+                collect(pending.popleft().result())
+        while pending:
+            collect(pending.popleft().result())
+
+    if log is not None:
+        log.write(_format_stats(stats) + "\n")
+    return stats
+
+
+def _format_stats(stats: dict) -> str:
+    seconds = max(stats["seconds"], 1e-9)
+    return "{} rendered, {} failed in {:.1f}s: {:.1f} charts/s, {:.1f} MB/s".format(
+        stats["rendered"],
+        stats["failed"],
+        stats["seconds"],
+        stats["rendered"] / seconds,
+        stats["bytes"] / seconds / 1e6,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m pyecharts.render.batch",
+        description="Render chart specs into html files over a process pool.",
+    )
+    parser.add_argument(
+        "source", help="a directory of .json specs, a .jsonl file or - for stdin"
+    )
+    parser.add_argument("output_dir", help="where the html files are written")
+    parser.add_argument(
+        "-p", "--processes", type=int, help="number of workers (all the CPUs)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=32, help="specs sent to a worker at once"
+    )
+    parser.add_argument("--template", default="simple_chart.html")
+    parser.add_argument(
+        "--interval", type=float, default=2.0, help="seconds between progress lines"
+    )
+    args = parser.parse_args(argv)
+    stats = render_batch(
+        args.source,
+        args.output_dir,
+        processes=args.processes,
+        chunk_size=args.chunk_size,
+        template_name=args.template,
+        interval=args.interval,
+    )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
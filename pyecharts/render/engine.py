@@ -1,10 +1,10 @@
 import os
 from collections import Iterable
 
-from jinja2 import Environment
+from jinja2 import Environment, FileSystemBytecodeCache
 
 from ..commons import utils
-from ..datasets import EXTRA, FILENAMES
+from ..datasets import FILENAMES, resolve_js_dependency
 from ..globals import CurrentConfig, NotebookType
 from ..types import Any, Optional
 from .display import HTML, Javascript
@@ -28,15 +28,9 @@ class RenderEngine:
             # TODO: if?
             if dep.startswith("https://api.map.baidu.com"):
                 links.append(dep)
-            if dep in FILENAMES:
-                f, ext = FILENAMES[dep]
-                links.append("{}{}.{}".format(chart.js_host, f, ext))
-            else:
-                for url, files in EXTRA.items():
-                    if dep in files:
-                        f, ext = files[dep]
-                        links.append("{}{}.{}".format(url, f, ext))
-                        break
+            resolved = resolve_js_dependency(dep, chart.js_host)
+            if resolved:
+                links.append("{}{}.{}".format(*resolved))
         chart.dependencies = links
         return chart
 
@@ -54,6 +48,22 @@ class RenderEngine:
         )
         write_utf8_html_file(path, html)
 
+    def render_chart_to_stream(
+        self, template_name: str, chart: Any, stream: Any, **kwargs
+    ):
+        """
+        Render a chart or page chunk by chunk into a writable text stream, the
+        whole html document is never held in memory.
+
+        :param chart: A Chart or Page object
+        :param stream: A file-like object with a `write` method
+        :param template_name: The name of template file.
+        """
+        tpl = self.env.get_template(template_name)
+        chunks = tpl.generate(chart=self.generate_js_link(chart), **kwargs)
+        for chunk in utils.iter_replace_placeholder(chunks):
+            stream.write(chunk)
+
     def render_chart_to_template(self, template_name: str, chart: Any, **kwargs) -> str:
         tpl = self.env.get_template(template_name)
         return utils.replace_placeholder(
@@ -74,6 +84,23 @@ def render(
     return os.path.abspath(path)
 
 
+def render_stream(
+    chart, stream: Any, template_name: str, env: Optional[Environment], **kwargs
+) -> Optional[str]:
+    engine = RenderEngine(env)
+    if not isinstance(stream, str):
+        engine.render_chart_to_stream(
+            template_name=template_name, chart=chart, stream=stream, **kwargs
+        )
+        return None
+
+    with open(stream, "w+", encoding="utf-8") as html_file:
+        engine.render_chart_to_stream(
+            template_name=template_name, chart=chart, stream=html_file, **kwargs
+        )
+    return os.path.abspath(stream)
+
+
 def render_embed(
     chart, template_name: str, env: Optional[Environment], **kwargs
 ) -> str:
@@ -109,6 +136,32 @@ def render_notebook(self, notebook_template, lab_template):
         print("%html " + self.render_embed())
 
 
+def precompile_templates(
+    env: Optional[Environment] = None, bytecode_cache_dir: Optional[str] = None
+) -> list:
+    """
+    Compile every template of `env` (CurrentConfig.GLOBAL_ENV by default) ahead
+    of the first render, e.g. at import time in the master process of a
+    pre-fork server so that workers inherit the compiled templates.
+
+    :param env: The jinja2 environment to warm up.
+    :param bytecode_cache_dir: If given, the compiled bytecode is also kept in
+        this directory and cold processes load it instead of compiling again.
+    :return: The names of the compiled templates.
+    """
+    env = env or CurrentConfig.GLOBAL_ENV
+    if bytecode_cache_dir is not None:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        env.bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+        if env.cache is not None:
+            # drop templates compiled before, so they reach the bytecode cache
+            env.cache.clear()
+    names = env.list_templates()
+    for name in names:
+        env.get_template(name)
+    return names
+
+
 def load_javascript(chart):
     scripts = []
     for dep in chart.js_dependencies.items:
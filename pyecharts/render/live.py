@@ -0,0 +1,114 @@
+import collections
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from ..types import List, Optional, Tuple
+
+
+class _EventStreamHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        channel = self.path.strip("/")
+        last_event_id = self.headers.get("Last-Event-ID")
+        if last_event_id is None:
+            last = self.server.last_event_id
+        else:
+            last = int(last_event_id)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        # pages are usually opened from local files
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        try:
+            while not self.server.closed:
+                events = self.server.wait_events(channel, last)
+                if not events:
+                    self.wfile.write(b": keepalive\n\n")
+                for last, message in events:
+                    lines = "".join("data: {}\n".format(s) for s in message.split("\n"))
+                    self.wfile.write("id: {}\n{}\n".format(last, lines).encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class LiveServer(socketserver.ThreadingMixIn, HTTPServer):
+    """
+    A local server-sent events endpoint pushing updates, such as the deltas
+    of `Chart.append_points`, to pages rendered with `simple_live_chart.html`
+    and `update_url=server.url(channel)`.
+
+    The last `backlog` messages of each channel are kept, so that browsers
+    reconnecting with a `Last-Event-ID` get the messages they missed.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        backlog: int = 1000,
+        keepalive: float = 15,
+    ):
+        super().__init__((host, port), _EventStreamHandler)
+        self.backlog = backlog
+        self.keepalive = keepalive
+        self.closed = False
+        self.last_event_id = 0
+        self._channels: dict = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def url(self, channel: str = "updates") -> str:
+        host, port = self.server_address[:2]
+        return "http://{}:{}/{}".format(host, port, channel)
+
+    def publish(self, message: str, channel: str = "updates") -> int:
+        """Send a message to every page listening to the channel, returns its id."""
+        with self._condition:
+            self.last_event_id += 1
+            events = self._channels.setdefault(
+                channel, collections.deque(maxlen=self.backlog)
+            )
+            events.append((self.last_event_id, message))
+            self._condition.notify_all()
+            return self.last_event_id
+
+    def wait_events(self, channel: str, last: int) -> List[Tuple[int, str]]:
+        """Wait up to `keepalive` seconds for the messages published after `last`"""
+
+        def pending():
+            events = self._channels.get(channel)
+            return [e for e in events if e[0] > last] if events else []
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.closed or pending(), timeout=self.keepalive
+            )
+            return pending()
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self.shutdown()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
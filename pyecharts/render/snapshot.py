@@ -1,10 +1,28 @@
 import base64
+import binascii
 import codecs
+import contextlib
 import logging
 import os
+import socketserver
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from io import BytesIO
 
-from ..types import Any
+from ..types import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +34,22 @@ SVG_FORMAT = "svg"
 EPS_FORMAT = "eps"
 B64_FORMAT = "base64"
 
+# data url mime types which are already in the format asked for, such images
+# are written as they are instead of going through PIL
+_MIME_TYPES = {
+    PDF_FORMAT: "application/pdf",
+    GIF_FORMAT: "image/gif",
+    EPS_FORMAT: "application/postscript",
+}
+
+# truthy in the browser once every echarts instance of the page has fired its
+# `finished` event, see `render_chart_content` in the templates macro
+FINISHED_SCRIPT = (
+    "return Array.prototype.every.call("
+    "document.querySelectorAll('[_echarts_instance_]'), "
+    "function (el) { return el.getAttribute('data-finished') === 'true'; });"
+)
+
 
 def make_snapshot(
     engine: Any,
@@ -40,18 +74,16 @@ def make_snapshot(
         save_as_text(content, output_name)
     else:
         # pdf, gif, png, jpeg
-        content_array = content.split(",")
-        if len(content_array) != 2:
-            raise OSError(content_array)
-
-        image_data = decode_base64(content_array[1])
-
-        if file_type in [PDF_FORMAT, GIF_FORMAT, EPS_FORMAT]:
-            save_as(image_data, output_name, file_type)
-        elif file_type in [PNG_FORMAT, JPG_FORMAT]:
-            save_as_png(image_data, output_name)
+        mime_type, start = split_data_url(content)
+        if file_type in [PNG_FORMAT, JPG_FORMAT] or (
+            _MIME_TYPES.get(file_type) == mime_type
+        ):
+            # decoded and written chunk by chunk
+            save_as_png(decode_base64_chunks(content, start), output_name)
+        elif file_type in [PDF_FORMAT, GIF_FORMAT, EPS_FORMAT]:
+            save_as(decode_base64(content[start:]), output_name, file_type)
         else:
-            raise TypeError("Not supported file type '%s'".format(file_type))
+            raise TypeError("Not supported file type '{}'".format(file_type))
 
     if "/" not in output_name:
         output_name = os.path.join(os.getcwd(), output_name)
@@ -61,6 +93,95 @@ def make_snapshot(
     logger.info("File saved in %s" % output_name)
 
 
+def make_snapshot_in_memory(
+    engine: Any,
+    chart: Any,
+    file_type: str = PNG_FORMAT,
+    delay: float = 2,
+    pixel_ratio: int = 2,
+    **kwargs,
+) -> Union[bytes, str]:
+    """
+    Take a snapshot of a chart (anything with `render_embed`) or of rendered
+    html without writing any file: the html is served to the engine from a
+    local http server and the image is returned instead of being saved.
+
+    :return: The image bytes, or text for svg and base64.
+    """
+    html = chart if isinstance(chart, (str, bytes)) else chart.render_embed()
+    with serve_html(html) as url:
+        content = engine.make_snapshot(
+            html_path=url,
+            file_type=file_type,
+            delay=delay,
+            pixel_ratio=pixel_ratio,
+            **kwargs,
+        )
+    if file_type in [SVG_FORMAT, B64_FORMAT]:
+        return content
+
+    mime_type, start = split_data_url(content)
+    if file_type in [PNG_FORMAT, JPG_FORMAT] or (
+        _MIME_TYPES.get(file_type) == mime_type
+    ):
+        return b"".join(decode_base64_chunks(content, start))
+    elif file_type in [PDF_FORMAT, GIF_FORMAT, EPS_FORMAT]:
+        output = BytesIO()
+        save_as(decode_base64(content[start:]), output, file_type)
+        return output.getvalue()
+    raise TypeError("Not supported file type '{}'".format(file_type))
+
+
+class _HTMLRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        html = self.server.pages.get(self.path)
+        if html is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(html)))
+        self.end_headers()
+        self.wfile.write(html)
+
+    def log_message(self, *args):
+        pass
+
+
+class _HTMLServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _HTMLRequestHandler)
+        self.pages: dict = {}
+
+
+_html_server: Optional[_HTMLServer] = None
+_html_server_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def serve_html(html: Union[str, bytes]):
+    """
+    Serve html kept in memory from a local http server (started on first use)
+    and yield its url, the page is dropped on exit.
+    """
+    global _html_server
+    with _html_server_lock:
+        if _html_server is None:
+            _html_server = _HTMLServer()
+            threading.Thread(target=_html_server.serve_forever, daemon=True).start()
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    path = "/{}.html".format(uuid.uuid4().hex)
+    _html_server.pages[path] = html
+    try:
+        host, port = _html_server.server_address[:2]
+        yield "http://{}:{}{}".format(host, port, path)
+    finally:
+        _html_server.pages.pop(path, None)
+
+
 def decode_base64(data: str) -> bytes:
     """Decode base64, padding being optional.
 
@@ -73,9 +194,52 @@ def decode_base64(data: str) -> bytes:
     return base64.decodebytes(data.encode("utf-8"))
 
 
-def save_as_png(image_data: bytes, output_name: str):
+def split_data_url(content: str) -> Tuple[str, int]:
+    """Locate the payload of a `data:<mime>;base64,<payload>` url.
+
+    :param content: The data url returned by a snapshot engine
+    :returns: The mime type and the index where the payload starts.
+    """
+    comma = content.find(",")
+    if comma == -1 or content.find(",", comma + 1) != -1:
+        raise OSError(content.split(","))
+    header = content[:comma]
+    if header.startswith("data:"):
+        header = header[5:]
+    return header.split(";")[0], comma + 1
+
+
+def decode_base64_chunks(
+    data: str, start: int = 0, chunk_size: int = 1 << 20
+) -> Iterator[bytes]:
+    """Decode base64 chunk by chunk, padding being optional.
+
+    Only one chunk is held at a time instead of copies of the whole payload.
+
+    :param data: Base64 data as an ASCII string
+    :param start: Index where the base64 data starts in `data`
+    :param chunk_size: Characters decoded at a time, a multiple of 4
+    :returns: An iterator over the decoded byte strings.
+    """
+    if any(c in data for c in " \t\r\n"):
+        # chunks would not be aligned on 4 characters
+        yield decode_base64("".join(data[start:].split()))
+        return
+    end = len(data)
+    for i in range(start, end, chunk_size):
+        chunk = data[i:min(i + chunk_size, end)]
+        missing_padding = len(chunk) % 4
+        if missing_padding != 0:
+            chunk += "=" * (4 - missing_padding)
+        yield binascii.a2b_base64(chunk)
+
+
+def save_as_png(image_data: Union[bytes, Iterable[bytes]], output_name: str):
+    if isinstance(image_data, bytes):
+        image_data = (image_data,)
     with open(output_name, "wb") as f:
-        f.write(image_data)
+        for chunk in image_data:
+            f.write(chunk)
 
 
 def save_as_text(image_data: str, output_name: str):
@@ -89,9 +253,142 @@ def save_as(image_data: bytes, output_name: str, file_type: str):
 
         m = Image.open(BytesIO(image_data))
         m.load()
-        color = (255, 255, 255)
-        b = Image.new("RGB", m.size, color)
-        b.paste(m, mask=m.split()[3])
+        if "A" in m.getbands():
+            color = (255, 255, 255)
+            b = Image.new("RGB", m.size, color)
+            b.paste(m, mask=m.getchannel("A"))
+        else:
+            # nothing to flatten
+            b = m.convert("RGB")
         b.save(output_name, file_type, quality=100)
     except ModuleNotFoundError:
         raise Exception("Please install PIL for {} image type".format(file_type))
+
+
+class WebDriverEngine:
+    """
+    A snapshot driver on a selenium-like `webdriver` (`get`, `execute_script`
+    and `quit`) which is kept open between snapshots.
+
+    The page is polled every `interval` seconds with `ready_script`, at most
+    for `timeout` seconds, instead of sleeping for `delay` seconds.
+    """
+
+    def __init__(self, webdriver: Any, timeout: float = 10, interval: float = 0.05):
+        self.webdriver = webdriver
+        self.timeout = timeout
+        self.interval = interval
+
+    def make_snapshot(
+        self,
+        html_path: str,
+        file_type: str,
+        delay: float = 2,
+        pixel_ratio: int = 2,
+        ready_script: Optional[str] = None,
+        **kwargs,
+    ) -> str:
+        if "://" not in html_path:
+            html_path = "file://" + os.path.abspath(html_path)
+        self.webdriver.get(html_path)
+        if ready_script is None:
+            time.sleep(delay)
+        else:
+            deadline = time.monotonic() + self.timeout
+            while not self.webdriver.execute_script(ready_script):
+                if time.monotonic() > deadline:
+                    raise TimeoutError("The charts did not finish rendering")
+                time.sleep(self.interval)
+        if file_type == SVG_FORMAT:
+            return self.webdriver.execute_script(
+                "return document.querySelector('div[_echarts_instance_] div')"
+                ".innerHTML;"
+            )
+        return self.webdriver.execute_script(
+            "return echarts.getInstanceByDom(document.querySelector("
+            "'div[_echarts_instance_]')).getDataURL({type: '%s', pixelRatio: %s, "
+            "excludeComponents: ['toolbox']});"
+            % (JPG_FORMAT if file_type == JPG_FORMAT else PNG_FORMAT, pixel_ratio)
+        )
+
+    def close(self):
+        self.webdriver.quit()
+
+
+class SnapshotPool:
+    """
+    Render snapshots concurrently on `size` long-lived drivers.
+
+    A driver is any object with the `make_snapshot` method of the snapshot
+    engines (`html_path`, `file_type`, `delay`, `pixel_ratio`, ...) which keeps
+    its browser page open between calls, and optionally a `close` or `quit`
+    method. `driver_factory` is called once in each worker thread, which then
+    keeps using its own driver. With drivers accepting it, such as
+    `WebDriverEngine`, `ready_script` (e.g. `FINISHED_SCRIPT`) is polled until
+    it returns true instead of sleeping for `delay` seconds; it is not passed
+    to the drivers when None.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], Any],
+        size: int = 4,
+        delay: float = 2,
+        ready_script: Optional[str] = None,
+    ):
+        self.delay = delay
+        self.ready_script = ready_script
+        self._driver_factory = driver_factory
+        self._drivers: List[Any] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _make_snapshot(self, file_name: str, output_name: str, **kwargs) -> str:
+        if self.ready_script is not None:
+            kwargs.setdefault("ready_script", self.ready_script)
+        kwargs.setdefault("delay", self.delay)
+        make_snapshot(self._get_driver(), file_name, output_name, **kwargs)
+        return output_name
+
+    def _get_driver(self) -> Any:
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = self._local.driver = self._driver_factory()
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def submit(self, file_name: str, output_name: str, **kwargs) -> Future:
+        """
+        Schedule a snapshot, kwargs are those of `make_snapshot`.
+
+        :return: A future resolving to output_name.
+        """
+        return self._executor.submit(
+            self._make_snapshot, file_name, output_name, **kwargs
+        )
+
+    def map(self, jobs: Iterable[Sequence[str]], **kwargs) -> List[str]:
+        """
+        Render (file_name, output_name) pairs concurrently.
+
+        :return: The output names, in the order of jobs.
+        """
+        futures = [self.submit(f, o, **kwargs) for f, o in jobs]
+        return [future.result() for future in futures]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for driver in self._drivers:
+            for method in ("close", "quit"):
+                if hasattr(driver, method):
+                    getattr(driver, method)()
+                    break
+        self._drivers = []
@@ -4,7 +4,13 @@ from io import StringIO
 from test import stdout_redirect
 from unittest.mock import patch
 
-from nose.tools import assert_equal, assert_greater, assert_in, assert_not_in
+from nose.tools import (
+    assert_equal,
+    assert_greater,
+    assert_in,
+    assert_not_in,
+    raises,
+)
 
 from pyecharts import options as opts
 from pyecharts.charts import Bar
@@ -265,3 +271,33 @@ def test_bar_with_brush(fake_writer):
     c.render()
     _, content = fake_writer.call_args[0]
     assert_in("brush", content)
+
+
+def test_bar_dataset():
+    c = (
+        Bar()
+        .add_dataset(
+            {"product": ["A", "B"], "2018": [1, 2], "2019": [3, 4]},
+            dimensions=["product", "2018", "2019"],
+        )
+        .add_yaxis("2018", encode={"x": "product", "y": "2018"})
+        .add_yaxis("2019", encode={"x": "product", "y": "2019"}, dataset_index=0)
+    )
+    options = c.get_options()
+    assert_equal(
+        options["dataset"],
+        [
+            {
+                "source": {"product": ["A", "B"], "2018": [1, 2], "2019": [3, 4]},
+                "dimensions": ["product", "2018", "2019"],
+            }
+        ],
+    )
+    assert_not_in("data", options["series"][0])
+    assert_equal(options["series"][1]["encode"], {"x": "product", "y": "2019"})
+    assert_equal(options["series"][1]["datasetIndex"], 0)
+
+
+@raises(ValueError)
+def test_bar_without_data_or_encode():
+    Bar().add_xaxis(["A"]).add_yaxis("a")
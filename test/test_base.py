@@ -1,9 +1,22 @@
+import array
+import base64
+import collections
+import decimal
+import io
+import os
 from unittest.mock import patch
 
-from nose.tools import assert_equal, assert_not_in
+from nose.tools import assert_equal, assert_false, assert_in, assert_not_in, assert_true
 
-from pyecharts.charts import Bar
-from pyecharts.charts.base import Base
+from pyecharts import options as opts
+from pyecharts.charts import Bar, Page, Scatter
+from pyecharts.charts.base import Base, OptionsEncoder
+from pyecharts.commons.utils import (
+    TYPED_ARRAY_DECODER,
+    ColumnarData,
+    JsCode,
+    TypedArray,
+)
 
 
 def test_base_add_functions():
@@ -30,3 +43,161 @@ def test_render(fake_writer):
     bar = Bar()
     bar.add_xaxis(["1"]).add_yaxis("", [1]).render(my_render_content=my_render_content)
     assert "test ok" == "test ok"
+
+
+def test_options_encoder_clean_values():
+    encoder = OptionsEncoder(indent=None)
+    content = encoder.encode(
+        {"a": None, "b": "", "c": [None, {"d": None, "e": 1}], "f": (1, 2.5)}
+    )
+    assert_equal(content, '{"c":[null,{"e":1}],"f":[1,2.5]}')
+
+
+def test_options_encoder_decimal_and_namedtuple():
+    point = collections.namedtuple("Point", "x y")
+    encoder = OptionsEncoder(indent=None)
+    content = encoder.encode(
+        {"a": decimal.Decimal("1.5"), "b": [point(1, 2), point(3, decimal.Decimal("4"))]}
+    )
+    assert_equal(content, '{"a":1.5,"b":[[1,2],[3,4]]}')
+    bar = Bar().add_xaxis(["a"]).add_yaxis("s", [decimal.Decimal("1.5")])
+    assert_in('"data": [\n                1.5\n', bar.dump_options())
+
+
+def test_options_encoder_basic_opts_and_js_code():
+    fn = "function (params) { return params.name; }"
+    options = {"label": opts.LabelOpts(formatter=JsCode(fn)), "nan": float("nan")}
+    content = OptionsEncoder().encode(options)
+    assert_in('"formatter": {}'.format(fn), content)
+    assert_in('"nan": null', content)
+
+    quoted = OptionsEncoder(js_code_quotes=True).encode(options)
+    assert_in('"formatter": "{}"'.format(fn), quoted)
+
+
+def test_options_encoder_nested_indent():
+    content = OptionsEncoder(indent=2).encode({"data": [[1, 2]], "empty": {"a": None}})
+    assert_equal(
+        content,
+        '{\n  "data": [\n    [\n      1,\n      2\n    ]\n  ],\n  "empty": {}\n}',
+    )
+
+
+def test_dump_options_is_repeatable():
+    c = Bar().add_xaxis(["A"]).add_yaxis("", [1])
+    c.set_series_opts(label_opts=opts.LabelOpts(formatter=JsCode("function\\n(){}")))
+    assert_equal(c.dump_options(), c.dump_options())
+
+
+def test_dump_options_compact():
+    c = Bar(opts.InitOpts(is_compact_json=True)).add_xaxis(["A"]).add_yaxis("", [1])
+    assert_not_in("\n", c.dump_options())
+    assert_in('"data":["A"]', c.dump_options())
+
+
+def test_dump_options_compact_global_config():
+    from pyecharts.globals import CurrentConfig
+
+    c = Bar().add_xaxis(["A"]).add_yaxis("", [1])
+    CurrentConfig.COMPACT_JSON = True
+    try:
+        assert_not_in("\n", c.dump_options())
+        assert_not_in("\n", Page().add(c).render_embed().split("var option_")[1][:80])
+    finally:
+        CurrentConfig.COMPACT_JSON = False
+    assert_in("\n", c.dump_options())
+
+
+def test_render_stream():
+    c = Bar().add_xaxis(["A"]).add_yaxis("", [1])
+    stream = io.StringIO()
+    assert_equal(c.render_stream(stream), None)
+    assert_equal(stream.getvalue(), c.render_embed())
+
+
+def test_page_render_stream_to_path():
+    page = Page().add(Bar().add_xaxis(["A"]).add_yaxis("", [1]))
+    path = page.render_stream("render_stream.html")
+    with open(path, encoding="utf-8") as f:
+        assert_equal(f.read(), page.render_embed())
+    os.unlink(path)
+
+
+def test_dump_options_cache():
+    def create_bar(**kwargs):
+        return (
+            Bar(init_opts=opts.InitOpts(**kwargs))
+            .add_xaxis(["A", "B", "C"])
+            .add_yaxis("series0", [1, 2, 4])
+            .set_global_opts(title_opts=opts.TitleOpts(title="bar"))
+        )
+
+    bar, expected = create_bar(is_cache_json=True), create_bar()
+    assert_equal(bar.dump_options(), expected.dump_options())
+    with patch.object(OptionsEncoder, "encode", wraps=OptionsEncoder().encode) as enc:
+        bar.dump_options()
+        # the top-level object only, nothing changed
+        assert_equal(enc.call_count, 1)
+
+    for chart in (bar, expected):
+        chart.options["series"][0]["data"].append(8)
+        chart.set_global_opts(title_opts=opts.TitleOpts(title="new"))
+    assert_equal(bar.dump_options(), expected.dump_options())
+    assert_equal(bar.dump_options_with_quotes(), expected.dump_options_with_quotes())
+
+    bar.options = {"title": {"text": "replaced"}}
+    assert_in('"text": "replaced"', bar.dump_options())
+
+    # a cleared option is left out, not taken back from the cache
+    bar.options["title"] = None
+    assert_not_in("replaced", bar.dump_options())
+    bar.options["title"] = {"text": "again"}
+    assert_in('"text": "again"', bar.dump_options())
+
+
+def test_dump_options_typed_array():
+    c = (
+        Scatter(init_opts=opts.InitOpts(is_typed_array=True, is_compact_json=True))
+        .add_xaxis(array.array("i", [1, 2]))
+        .add_yaxis("buffer", array.array("d", [0.5, 4]))
+        .add_yaxis("list", [3, 4])
+    )
+    content = c.dump_options()
+    raw = base64.b64encode(array.array("d", [1, 0.5, 2, 4]).tobytes()).decode()
+    typed = "pyecharts_typed_array('Float64Array', '{}')".format(raw)
+    assert_in('"data":{}'.format(typed), content)
+    assert_in('"data":[[1,3],[2,4]]', content)
+    assert_equal(c.js_functions.items, [TYPED_ARRAY_DECODER])
+    # the options are left as they are
+    assert_equal(c.options["series"][0]["data"][1], [2, 4.0])
+
+
+def test_dump_options_typed_array_only_named_types():
+    init_opts = opts.InitOpts(is_typed_array=True, is_compact_json=True)
+    bar = Bar(init_opts).add_xaxis(["A", "B"]).add_yaxis("a", array.array("d", [1, 2]))
+    assert_in('"data":[1.0,2.0]', bar.dump_options())
+    assert_equal(bar.js_functions.items, [])
+
+    # x, y and size columns are not what a scatter typed array holds
+    c = Scatter(init_opts).add_xaxis(array.array("i", [1, 2]))
+    c.options["series"].append(
+        {
+            "type": "scatter",
+            "data": ColumnarData(*[array.array("d", [1, 2])] * 3),
+        }
+    )
+    assert_in('"data":[[1.0,1.0,1.0],[2.0,2.0,2.0]]', c.dump_options())
+    assert_equal(c.js_functions.items, [])
+
+
+def test_typed_array_lines():
+    coords = [array.array("f", [x + 0.5 for x in range(2)]) for _ in range(4)]
+    data = ColumnarData(*coords)
+    assert_true(TypedArray.accepts(data, "lines"))
+    assert_false(TypedArray.accepts(data, "scatter"))
+    assert_false(TypedArray.accepts(coords[0], "scatter"))
+    js = TypedArray(data, "lines").to_js().js_code
+    expected = array.array("f", [2, 0.5, 0.5, 0.5, 0.5, 2, 1.5, 1.5, 1.5, 1.5])
+    raw = base64.b64encode(expected.tobytes()).decode()
+    typed = "pyecharts_typed_array('Float32Array', '{}')".format(raw)
+    assert_equal(js, JsCode(typed).js_code)
@@ -0,0 +1,58 @@
+import io
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from nose.tools import assert_equal, assert_false, assert_in
+
+from pyecharts.charts import Bar
+from pyecharts.render.batch import _read_tasks, main, render_batch
+
+
+def _spec(i: int) -> dict:
+    bar = Bar().add_xaxis(["A", "B"]).add_yaxis("series0", [i, 2])
+    return {
+        "options": json.loads(bar.dump_options()),
+        "init_opts": {"chart_id": "chart{}".format(i), "page_title": "batch"},
+    }
+
+
+def test_render_batch_jsonl():
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "specs.jsonl")
+        with open(source, "w", encoding="utf-8") as f:
+            for i in range(5):
+                f.write(json.dumps(_spec(i)) + "\n")
+            f.write(json.dumps(dict(_spec(5), path="sub/named.html")) + "\n")
+            f.write('{"init_opts": {}}\n')
+        log = io.StringIO()
+        output = os.path.join(directory, "out")
+        stats = render_batch(source, output, processes=2, chunk_size=2, log=log)
+
+        assert_equal((stats["rendered"], stats["failed"]), (6, 1))
+        assert_in("failed 000006: KeyError", log.getvalue())
+        assert_in("6 rendered, 1 failed", log.getvalue())
+        with open(os.path.join(output, "000003.html"), encoding="utf-8") as f:
+            content = f.read()
+        assert_in("<title>batch</title>", content)
+        assert_in("chart_chart3", content)
+        assert os.path.exists(os.path.join(output, "sub", "named.html"))
+
+
+def test_render_batch_main():
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(3):
+            with open(os.path.join(directory, "c{}.json".format(i)), "w") as f:
+                json.dump(_spec(i), f)
+        output = os.path.join(directory, "out")
+        assert_equal(main([directory, output, "--processes", "1"]), 0)
+        assert_equal(sorted(os.listdir(output)), ["c0.html", "c1.html", "c2.html"])
+
+
+def test_read_tasks_stdin():
+    stdin = io.StringIO('{"a": 1}\n\n{"b": 2}\n')
+    with patch("sys.stdin", stdin):
+        tasks = list(_read_tasks("-"))
+    assert_equal([name for name, _, _ in tasks], ["000000", "000002"])
+    assert_false(stdin.closed)
@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from nose.tools import assert_in
+from nose.tools import assert_equal, assert_in
 
 from pyecharts import options as opts
 from pyecharts.charts import BMap
@@ -140,3 +140,14 @@ def test_bmap_progressive_options(fake_writer):
     content = fake_writer.call_args[0][1]
     assert_in("progressive", content)
     assert_in("progressiveThreshold", content)
+
+
+def test_bmap_feed_data_iterator():
+    bmap = (
+        BMap()
+        .add_schema(baidu_ak=FAKE_API_KEY, center=[-0.118092, 51.509865])
+        .add_coordinate("London", -0.118092, 51.509865)
+        .add("bmap", zip(TEST_LOCATION, TEST_VALUE))
+    )
+    data = bmap.options.get("series")[0]["data"]
+    assert_equal(data, [{"name": "London", "value": [-0.118092, 51.509865, 1]}])
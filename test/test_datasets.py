@@ -1,9 +1,17 @@
 import os
 from unittest.mock import patch
 
-from nose.tools import assert_equal, raises
+from nose.tools import assert_equal, assert_false, assert_true, raises
 
-from pyecharts.datasets import EXTRA, FuzzyDict, register_url
+from pyecharts.datasets import (
+    EXTRA,
+    FILENAMES,
+    FuzzyDict,
+    _LazyFuzzyDict,
+    register_files,
+    register_url,
+    resolve_js_dependency,
+)
 
 
 @patch("pyecharts.datasets.urllib.request.urlopen")
@@ -36,3 +44,65 @@ def test_fuzzy_search_key_error():
     fd = FuzzyDict()
     fd.cutoff = 0.9
     _ = fd["我是北京"]
+
+
+def test_fuzzy_search_dict_best_match():
+    fd = FuzzyDict()
+    fd.update({"北京市": 1, "北京市朝阳区": 2, "天津市": 3})
+    assert_equal(fd["北京"], 1)
+    assert_true("北京" in fd)
+    assert_false("广州" in fd)
+
+
+def test_fuzzy_search_dict_invalidated_on_update():
+    fd = FuzzyDict()
+    fd["上海市"] = 1
+    assert_false("广州" in fd)
+    fd.update({"广州市": 2})
+    assert_true("广州" in fd)
+    assert_equal(fd["广州"], 2)
+    del fd["广州市"]
+    assert_false("广州" in fd)
+
+
+def test_lazy_fuzzy_dict():
+    current_path = os.path.dirname(__file__)
+    fd = _LazyFuzzyDict(os.path.join(current_path, "fixtures", "registry.json"))
+    assert_false(fd._loaded)
+    assert_true("PINYIN_MAP" in fd)
+    assert_true(fd._loaded)
+    assert_equal(fd["JS_FOLDER"], "js")
+
+    fd = _LazyFuzzyDict(os.path.join(current_path, "fixtures", "registry.json"))
+    fd.update({"extra": 1})
+    assert_equal(len(fd), 8)
+
+
+def test_resolve_js_dependency():
+    host = "https://assets.pyecharts.org/assets/"
+    assert_equal(resolve_js_dependency("echarts", host), (host, "echarts.min", "js"))
+    assert_equal(resolve_js_dependency("nonexistent_xyz", host), None)
+
+    try:
+        register_files({"nonexistent_xyz": ["maps/xyz", "js"]})
+        assert_equal(
+            resolve_js_dependency("nonexistent_xyz", host), (host, "maps/xyz", "js")
+        )
+        # modified directly, without register_files
+        FILENAMES["nonexistent_xyz"] = ["maps/abc", "js"]
+        assert_equal(
+            resolve_js_dependency("nonexistent_xyz", host), (host, "maps/abc", "js")
+        )
+    finally:
+        del FILENAMES["nonexistent_xyz"]
+    assert_equal(resolve_js_dependency("nonexistent_xyz", host), None)
+
+    EXTRA["https://example.com/"] = {"nonexistent_xyz": ["xyz", "js"]}
+    try:
+        assert_equal(
+            resolve_js_dependency("nonexistent_xyz", host),
+            ("https://example.com/", "xyz", "js"),
+        )
+    finally:
+        del EXTRA["https://example.com/"]
+    assert_equal(resolve_js_dependency("nonexistent_xyz", host), None)
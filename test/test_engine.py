@@ -0,0 +1,26 @@
+import os
+import shutil
+import tempfile
+
+from jinja2 import Environment, FileSystemLoader
+from nose.tools import assert_in, assert_true
+
+from pyecharts.globals import CurrentConfig
+from pyecharts.render.engine import precompile_templates
+
+
+def test_precompile_templates():
+    names = precompile_templates()
+    assert_in("macro", names)
+    assert_in("simple_chart.html", names)
+
+
+def test_precompile_templates_bytecode_cache():
+    cache_dir = tempfile.mkdtemp()
+    loader = FileSystemLoader(CurrentConfig.GLOBAL_ENV.loader.searchpath)
+    env = Environment(loader=loader)
+    try:
+        precompile_templates(env, bytecode_cache_dir=cache_dir)
+        assert_true(len(os.listdir(cache_dir)) > 0)
+    finally:
+        shutil.rmtree(cache_dir)
@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from nose.tools import assert_equal, assert_in
+from nose.tools import assert_equal, assert_in, raises
 
 from pyecharts import options as opts
 from pyecharts.charts import Geo
@@ -64,3 +64,36 @@ def test_geo_dump_options_with_quotes():
     c = _geo_chart()
     formatter = """"formatter": "function (params) {        return params.name + ' : ' + params.value[2];    }"""  # noqa
     assert_in(formatter, c.dump_options_with_quotes())
+
+
+def test_geo_get_coordinates():
+    c = Geo()
+    with patch.object(c, "get_coordinate", wraps=c.get_coordinate) as fake:
+        coords, misses = c.get_coordinates(["北京", "上海", "北京", "no-where"])
+    assert_equal(fake.call_count, 3)
+    assert_equal(coords[0], coords[2])
+    assert_equal(coords[3], None)
+    assert_equal(misses, ["no-where"])
+
+
+def test_geo_lines_feed_data():
+    c = Geo().add_schema().add("lines", [("北京", "上海")], type_="lines")
+    data = c.options["series"][0]["data"][0]
+    assert_equal(data["name"], "北京->上海")
+    assert_equal(data["coords"], [c.get_coordinate("北京"), c.get_coordinate("上海")])
+
+
+def test_geo_feed_data_iterator():
+    names, values = ["北京", "上海"], [1, 2]
+    c = Geo().add_schema().add("scatter", zip(names, values))
+    data = c.options["series"][0]["data"]
+    assert_equal([d["name"] for d in data], names)
+    assert_equal(data[1]["value"], list(c.get_coordinate("上海")) + [2])
+
+    c.add("lines", zip(["北京"], ["上海"]), type_="lines")
+    assert_equal(c.options["series"][1]["data"][0]["name"], "北京->上海")
+
+
+@raises(ValueError)
+def test_geo_lines_bad_pair():
+    Geo().add_schema().add("lines", [("北京", "上海", "广州")], type_="lines")
@@ -71,3 +71,16 @@ def test_grid_options(fake_writer):
     gc.render()
     _, content = fake_writer.call_args[0]
     assert_in("containLabel", content)
+
+
+def test_grid_shares_first_chart_data():
+    bar = _chart_for_grid()
+    line = Line().add_xaxis(["a"]).add_yaxis("b", [1])
+    grid = Grid().add(bar, grid_opts=opts.GridOpts()).add(line, opts.GridOpts())
+    # the data is shared, the containers updated by the grid are not
+    for grid_series, series in zip(grid.options["series"], bar.options["series"]):
+        assert grid_series is not series
+        assert grid_series["data"] is series["data"]
+    assert_equal(len(bar.options["series"]), 3)
+    assert_equal(len(grid.options["series"]), 4)
+    assert_equal(len(bar.options["xAxis"]), 1)
@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from nose.tools import assert_equal, assert_in
+from nose.tools import assert_equal, assert_in, assert_raises
 
 from pyecharts import options as opts
 from pyecharts.charts import Kline
@@ -55,3 +55,41 @@ def test_kline_axispointer_opts(fake_writer):
     c.render()
     _, content = fake_writer.call_args[0]
     assert_in("axisPointer", content)
+
+
+def test_kline_downsample():
+    c = (
+        Kline()
+        .add_xaxis(["2017/7/{}".format(i + 1) for i in range(len(data))])
+        .add_yaxis("kline", data, downsample_threshold=2)
+    )
+    candles = c.options["series"][0]["data"]
+    assert_equal(len(candles), 2)
+    assert_equal(candles[0][0], data[0][0])
+    assert_equal(candles[-1][1], data[-1][1])
+    assert_equal(c.options["xAxis"][0]["data"][0], "2017/7/1")
+    assert_equal(len(c.options["xAxis"][0]["data"]), 2)
+
+
+def test_kline_downsample_multi_series():
+    x_data = ["2017/7/{}".format(i + 1) for i in range(len(data))]
+    c = (
+        Kline()
+        .add_xaxis(x_data)
+        .add_yaxis("k1", data, downsample_threshold=2)
+        .add_yaxis("k2", data, downsample_threshold=2)
+    )
+    assert_equal(c.options["xAxis"][0]["data"], [x_data[0], x_data[len(data) // 2]])
+    assert_equal(c.options["series"][0]["data"], c.options["series"][1]["data"])
+
+    # the candles would not line up with the x axis
+    with assert_raises(ValueError):
+        c.add_yaxis("raw", data)
+    with assert_raises(ValueError):
+        c.add_yaxis("other", data, downsample_threshold=3)
+    with assert_raises(ValueError):
+        Kline().add_xaxis(x_data).add_yaxis("raw", data).add_yaxis(
+            "k", data, downsample_threshold=2
+        )
+    assert_equal(len(c.options["series"]), 2)
+    assert_equal(len(c.options["legend"][0]["data"]), 2)
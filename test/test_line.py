@@ -1,6 +1,10 @@
+import array
+import json
+import os
+import tempfile
 from unittest.mock import patch
 
-from nose.tools import assert_equal, assert_in
+from nose.tools import assert_equal, assert_in, assert_not_in, assert_true, raises
 
 from pyecharts import options as opts
 from pyecharts.charts import Line
@@ -66,3 +70,98 @@ def test_line_opts_with_zlevel_z(fake_writer):
     _, content = fake_writer.call_args[0]
     assert_in("zlevel", content)
     assert_in("z", content)
+
+
+def test_line_buffer_data():
+    c = (
+        Line({"is_compact_json": True})
+        .add_xaxis(array.array("i", [1, 2, 3]))
+        .add_yaxis("series0", array.array("d", [1.5, float("nan"), 3]))
+    )
+    content = c.dump_options()
+    assert_in('"data":[[1,1.5],[2,null],[3,3.0]]', content)
+    assert_in('"data":[1,2,3]', content)
+
+
+def test_line_downsample():
+    x = ["day{}".format(i) for i in range(100)]
+    y = [i % 7 for i in range(100)]
+    c = Line().add_xaxis(x).add_yaxis("s", y, downsample="lttb", downsample_threshold=20)
+    data = c.options["series"][0]["data"]
+    assert_equal(len(data), 20)
+    assert_equal((data[0], data[-1]), (["day0", 0], ["day99", 1]))
+    # only the labels of the points kept
+    assert_equal(c.options["xAxis"][0]["data"], [x for x, _ in data])
+
+    c.add_yaxis("t", y[::-1], downsample="minmax", downsample_threshold=10)
+    labels = c.options["xAxis"][0]["data"]
+    kept = {x for s in c.options["series"] for x, _ in s["data"]}
+    assert_equal(labels, [x for x in c._xaxis_data if x in kept])
+    assert_true(20 < len(labels) <= 30)
+
+    # a series with all the points needs all the labels
+    c.add_yaxis("u", y)
+    assert_equal(c.options["xAxis"][0]["data"], x)
+
+
+def test_line_downsample_payload():
+    x = ["2019-01-01 00:{:05d}".format(i) for i in range(10000)]
+    y = [i % 97 for i in range(10000)]
+    c = Line().add_xaxis(x)
+    c.add_yaxis("s", y, downsample="lttb", downsample_threshold=100)
+    content = c.dump_options()
+    assert_equal(content.count("2019-01-01"), 200)
+
+
+@patch("pyecharts.render.engine.write_utf8_html_file")
+def test_line_zoom_levels(fake_writer):
+    def _chart(**kwargs):
+        n = 2000
+        return (
+            Line()
+            .add_xaxis(list(range(n)))
+            .add_yaxis("series0", [i % 13 for i in range(n)])
+            .add_yaxis("series1", [1, 2, 3])
+            .set_global_opts(datazoom_opts=opts.DataZoomOpts())
+            .set_zoom_levels(threshold=100, **kwargs)
+        )
+
+    c = _chart()
+    assert_equal(len(c.options["series"][0]["data"]), 100)
+    assert_equal(len(c.options["series"][1]["data"]), 3)
+    levels = json.loads(c._zoom_levels)
+    assert_equal(len(levels["series"]), 1)
+    # 400 and 1600 points levels, then every point
+    assert_equal([len(tiles) for tiles in levels["series"][0]["levels"]], [4, 16, 20])
+    assert_equal(levels["series"][0]["levels"][-1][-1], [1900, 1999])
+    assert_equal(json.loads(c._zoom_tiles["0_3_0"])[:2], [[0, 0], [1, 1]])
+
+    c.render()
+    _, content = fake_writer.call_args[0]
+    assert_in('id="tile_{}_0_3_19"'.format(c.chart_id), content)
+    assert_in("chart.on('datazoom'", content)
+
+    c = _chart(tile_url="tiles")
+    c.render()
+    _, content = fake_writer.call_args[0]
+    assert_not_in('type="application/json"', content)
+    with tempfile.TemporaryDirectory() as directory:
+        c.dump_zoom_tiles(directory)
+        with open(os.path.join(directory, "0", "3", "19.json")) as f:
+            assert_equal(json.loads(f.read())[-1], [1999, 1999 % 13])
+
+
+def test_line_dataset():
+    dates = ["2019-01-0{}".format(i) for i in range(1, 8)]
+    c = Line({"is_compact_json": True}).add_dataset({"date": dates, "a": list(range(7))})
+    for name in ("a", "b", "c"):
+        c.add_yaxis(name, encode={"x": "date", "y": "a"})
+    content = c.dump_options()
+    # the shared column is serialized once
+    assert_equal(content.count("2019-01-07"), 1)
+    assert_in('"encode":{"x":"date","y":"a"}', content)
+
+
+@raises(ValueError)
+def test_line_without_data_or_encode():
+    Line().add_xaxis(["A"]).add_yaxis("a")
@@ -0,0 +1,70 @@
+import http.client
+import json
+from unittest.mock import patch
+
+from nose.tools import assert_equal, assert_in
+
+from pyecharts.charts import Line, Scatter
+from pyecharts.render import LiveServer
+
+
+def _read_event(response) -> dict:
+    event = {}
+    while True:
+        line = response.fp.readline().decode("utf-8").rstrip("\n")
+        if not line:
+            if event:
+                return event
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(": ")
+        if field in event:
+            value = event[field] + "\n" + value
+        event[field] = value
+
+
+def test_append_points():
+    c = Line().add_xaxis(["A", "B"]).add_yaxis("series0", [1, 2])
+    delta = c.append_points(0, [["C", 3]], xaxis_data=["C"])
+    assert_equal(
+        json.loads(delta), {"seriesIndex": 0, "data": [["C", 3]], "xAxisData": ["C"]}
+    )
+    assert_equal(c.options["series"][0]["data"], [["A", 1], ["B", 2], ["C", 3]])
+    assert_equal(c.options["xAxis"][0]["data"], ["A", "B", "C"])
+
+
+def test_append_points_to_tuple_data():
+    c = Scatter().add_xaxis([1, 2]).add_yaxis("series0", [3, 4])
+    c.options["series"][0]["data"] = ((1, 3), (2, 4))
+    assert_equal(c.append_points(0, [(3, 5)]), '{"seriesIndex":0,"data":[[3,5]]}')
+    assert_equal(c.options["series"][0]["data"], [(1, 3), (2, 4), (3, 5)])
+
+
+@patch("pyecharts.render.engine.write_utf8_html_file")
+def test_render_live_chart(fake_writer):
+    c = Line().add_xaxis(["A"]).add_yaxis("series0", [1])
+    c.render(template_name="simple_live_chart.html", update_url="http://h:1/c")
+    _, content = fake_writer.call_args[0]
+    assert_in("new EventSource('http://h:1/c')", content)
+    assert_in("var chart = chart_{};".format(c.chart_id), content)
+
+
+def test_live_server():
+    with LiveServer(keepalive=0.1) as server:
+        first = server.publish('{"seriesIndex":0,"data":[1]}', channel="metrics")
+        server.publish("ignored", channel="other")
+        host, port = server.server_address[:2]
+        conn = http.client.HTTPConnection(host, port, timeout=5)
+        # replay what was published since the given id
+        conn.request("GET", "/metrics", headers={"Last-Event-ID": str(first - 1)})
+        response = conn.getresponse()
+        assert_equal(response.getheader("Content-Type"), "text/event-stream")
+        assert_equal(
+            _read_event(response),
+            {"id": str(first), "data": '{"seriesIndex":0,"data":[1]}'},
+        )
+        last = server.publish("a\nb", channel="metrics")
+        assert_equal(_read_event(response), {"id": str(last), "data": "a\nb"})
+        conn.close()
+    assert_equal(server.url("metrics"), "http://{}:{}/metrics".format(host, port))
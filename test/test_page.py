@@ -9,10 +9,12 @@ from nose.tools import (
     raises,
 )
 
-from pyecharts.charts import Bar, Line, Page
+from pyecharts.charts import Bar, Line, Page, Timeline, base
+from pyecharts.charts.base import shutdown_dump_executors
 from pyecharts.commons.utils import OrderedSet
 from pyecharts.components import Table
 from pyecharts.faker import Faker
+from pyecharts.globals import CurrentConfig
 
 
 def _create_bar() -> Bar:
@@ -163,3 +165,78 @@ def test_page_resize():
     )
     assert_not_in(".resizable()", content)
     assert_not_in(".draggable()", content)
+
+
+def test_page_shared_options():
+    page = Page(is_shared_options=True)
+    page.add(_create_bar(), _create_line(), _create_table())
+    content = page.render_embed()
+    assert_in("var shared_options_", content)
+    bar, line, _ = page
+    assert_in('"color": shared_options_', bar.json_contents)
+    assert_in('"color": shared_options_', line.json_contents)
+    assert_in('"series": [', bar.json_contents)
+    page = Page().add(_create_bar(), _create_line(), _create_table())
+    assert_true(len(content) < len(page.render_embed()))
+
+
+def test_page_shared_options_cached_chart():
+    bar = Bar({"is_cache_json": True}).add_xaxis(Faker.week).add_yaxis("A", [1, 2])
+    page = Page(is_shared_options=True).add(bar, _create_line())
+    page.render_embed()
+    (cache,) = bar._json_cache.values()
+    xaxis = cache["xAxis"]
+    bar.options["title"] = {"text": "cached"}
+    page.render_embed()
+    # only the touched option is encoded again
+    assert_true(cache["xAxis"] is xaxis)
+    assert_in('"text": "cached"', bar.json_contents)
+    assert_in('"color": shared_options_', bar.json_contents)
+
+
+def test_page_shared_options_single_chart():
+    page = Page(is_shared_options=True).add(_create_bar())
+    content = page.render_embed()
+    assert_not_in("shared_options_", content)
+
+
+def test_page_dump_options_in_processes():
+    page = Page().add(_create_bar(), _create_line(), _create_table())
+    page.render_embed()
+    expected = [c.json_contents for c in page if hasattr(c, "dump_options")]
+
+    CurrentConfig.DUMP_EXECUTOR = 2
+    try:
+        page.render_embed()
+    finally:
+        CurrentConfig.DUMP_EXECUTOR = None
+        shutdown_dump_executors()
+    assert_equal(base._process_pools, {})
+    assert_equal([c.json_contents for c in page if hasattr(c, "dump_options")], expected)
+
+
+def test_page_lazy():
+    bar, line = _create_bar(), _create_line()
+    content = Page(is_lazy=True).add(bar, line).render_embed()
+    lazy = '<script type="text/x-pyecharts-chart" id="init_{}">'
+    assert_in(lazy.format(bar.chart_id), content)
+    assert_in("new IntersectionObserver(", content)
+    assert_not_in(".dispose()", content)
+    assert_equal(content.count("echarts.init("), 2)
+    # both only in the inert init scripts
+    assert_not_in("echarts.init(", content.split("text/x-pyecharts-chart")[0])
+
+    page = Page(is_lazy=True, is_dispose_offscreen=True).add(_create_bar())
+    assert_in(".dispose()", page.render_embed())
+
+
+def test_page_diffed_timeline():
+    for is_shared_options in (False, True):
+        tl = Timeline(is_diff_frames=True)
+        for year in range(2015, 2018):
+            tl.add(_create_bar(), str(year))
+        page = Page(is_shared_options=is_shared_options)
+        page.add(tl, _create_bar())
+        page.render_embed()
+        # the frames are diffed as when the timeline is dumped alone
+        assert_equal(tl.json_contents, tl.dump_options())
@@ -0,0 +1,74 @@
+from unittest import SkipTest
+from unittest.mock import patch
+
+from nose.tools import assert_equal, assert_in, raises
+
+from pyecharts.commons import sampling
+
+_Y = [0, 1, 0, 5, 0, 1, None, 1, -4, 1, 0, 1]
+
+
+def _numpy_or_skip():
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("numpy is not installed")
+    return numpy
+
+
+def test_lttb():
+    indices = sampling.lttb(range(len(_Y)), _Y, 5)
+    assert_equal(len(indices), 5)
+    assert_equal((indices[0], indices[-1]), (0, len(_Y) - 1))
+    # the peaks are kept
+    assert_in(3, indices)
+    assert_in(8, indices)
+    assert_equal(sampling.lttb(None, _Y, 100), list(range(len(_Y))))
+
+
+def test_lttb_category_x():
+    x = ["day{}".format(i) for i in range(len(_Y))]
+    assert_equal(sampling.lttb(x, _Y, 5), sampling.lttb(None, _Y, 5))
+
+
+def test_min_max():
+    indices = sampling.min_max(_Y, 4)
+    assert_equal(indices, [0, 3, 7, 8])
+    assert_equal(indices, sorted(indices))
+
+
+def test_ohlc():
+    rows = [[1, 2, 0, 3], [2, 3, 1, 4], [3, 1, -1, 3], [1, 5, 1, 6], [5, 4, 3, 7]]
+    starts, aggregated = sampling.ohlc(rows, 2)
+    assert_equal(starts, [0, 2])
+    assert_equal(aggregated, [[1, 3, 0, 4], [3, 4, -1, 7]])
+
+
+@patch("pyecharts.commons.sampling._numpy", lambda: None)
+def test_pure_python_fallback():
+    assert_equal(sampling.min_max(_Y, 4), [0, 3, 7, 8])
+    assert_in(8, sampling.lttb(None, _Y, 5))
+    rows = [[1, 2, 0, 3], [2, 3, 1, 4], [3, 1, -1, 3]]
+    assert_equal(sampling.ohlc(rows, 1), ([0], [[1, 1, -1, 4]]))
+
+
+def test_numpy_and_pure_python_agree():
+    np = _numpy_or_skip()
+    y = np.sin(np.arange(5000) / 100.0) + np.cos(np.arange(5000) / 7.0)
+    expected = (sampling.lttb(None, y, 300), sampling.min_max(y, 300))
+    with patch("pyecharts.commons.sampling._numpy", lambda: None):
+        assert_equal((sampling.lttb(None, y, 300), sampling.min_max(y, 300)), expected)
+    assert_equal(sampling.take(y, [0, 2]).tolist(), [y[0], y[2]])
+
+
+@raises(ValueError)
+def test_unknown_method():
+    sampling.downsample_indices("average", None, _Y, 5)
+
+
+def test_pyramid():
+    y = list(range(100))
+    levels = sampling.pyramid(sampling.MIN_MAX, None, y, 10, factor=3)
+    assert_equal([len(level) for level in levels], [10, 30, 90, 100])
+    assert_equal(levels[-1], y)
+    assert_equal(sampling.pyramid(sampling.LTTB, None, y, 100), [y])
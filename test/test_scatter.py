@@ -1,6 +1,7 @@
+from unittest import SkipTest
 from unittest.mock import patch
 
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_in, raises
 
 from pyecharts.charts import Scatter
 
@@ -17,3 +18,43 @@ def test_bar_base(fake_writer):
     _, content = fake_writer.call_args[0]
     assert_equal(c.theme, "white")
     assert_equal(c.renderer, "canvas")
+
+
+def test_scatter_numpy_data():
+    try:
+        import numpy as np
+    except ImportError:
+        raise SkipTest("numpy is not installed")
+
+    c = (
+        Scatter({"is_compact_json": True})
+        .add_xaxis(np.array([1, 2]))
+        .add_yaxis("series0", np.array([[1.0, np.nan], [np.inf, 4.0]]))
+    )
+    assert_equal(c.options["series"][0]["data"][1], [2, np.inf, 4.0])
+    assert_in('"data":[[1,1.0,null],[2,null,4.0]]', c.dump_options())
+
+
+def test_scatter_downsample():
+    x = list(range(100))
+    y = [[i % 9, i] for i in range(100)]
+    c = Scatter().add_xaxis(x).add_yaxis(
+        "s", y, downsample="minmax", downsample_threshold=10
+    )
+    data = c.options["series"][0]["data"]
+    assert_equal(len(data), 10)
+    assert_equal(data[0], [0, 0, 0])
+    # numbers are positions on a category axis, all the labels are kept
+    assert_equal(c.options["xAxis"][0]["data"], x)
+
+    labels = ["p{}".format(i) for i in x]
+    c = Scatter().add_xaxis(labels).add_yaxis(
+        "s", y, downsample="minmax", downsample_threshold=10
+    )
+    data = c.options["series"][0]["data"]
+    assert_equal(c.options["xAxis"][0]["data"], [d[0] for d in data])
+
+
+@raises(ValueError)
+def test_scatter_without_data_or_encode():
+    Scatter().add_xaxis(["A"]).add_yaxis("a")
@@ -1,9 +1,22 @@
+import threading
+import urllib.request
 from unittest.mock import patch
 
-from nose.tools import assert_equal, raises
+from nose.tools import assert_equal, assert_in, assert_true, raises
 
 from pyecharts.charts import Bar
-from pyecharts.render import make_snapshot
+from pyecharts.render import (
+    SnapshotPool,
+    WebDriverEngine,
+    make_snapshot,
+    make_snapshot_in_memory,
+)
+from pyecharts.render.snapshot import (
+    FINISHED_SCRIPT,
+    decode_base64,
+    decode_base64_chunks,
+    split_data_url,
+)
 
 
 def _gen_faker_engine(content: str):
@@ -64,3 +77,155 @@ def test_make_snapshot_text(fake_writer):
     make_snapshot(eng, _gen_bar_chart(), "make_snapshot.svg")
     _ = fake_writer.call_args[0]
     assert_equal("test ok", "test ok")
+
+
+class _FakeDriver:
+    """Stand-in for a long-lived browser page"""
+
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+        self.closed = False
+
+    def make_snapshot(self, html_path, file_type, delay, pixel_ratio, **kwargs):
+        self.calls.append((html_path, delay, kwargs.get("ready_script")))
+        self.threads.add(threading.get_ident())
+        return "data:image/png;base64,ZmFrZQ"
+
+    def close(self):
+        self.closed = True
+
+
+@patch("pyecharts.render.snapshot.save_as_png")
+def test_snapshot_pool(fake_writer):
+    drivers = []
+
+    def factory():
+        drivers.append(_FakeDriver())
+        return drivers[-1]
+
+    jobs = [("chart{}.html".format(i), "chart{}.png".format(i)) for i in range(20)]
+    pool = SnapshotPool(factory, size=3, delay=0, ready_script=FINISHED_SCRIPT)
+    with pool:
+        assert_equal(pool.map(jobs), [o for _, o in jobs])
+
+    assert_true(0 < len(drivers) <= 3)
+    assert_equal(sum(len(d.calls) for d in drivers), 20)
+    assert_true(all(d.closed for d in drivers))
+    assert_true(all(len(d.threads) == 1 for d in drivers))
+    for d in drivers:
+        for _, delay, ready_script in d.calls:
+            assert_equal((delay, ready_script), (0, FINISHED_SCRIPT))
+    assert_equal(fake_writer.call_count, 20)
+    written = [(b"".join(c[0][0]), c[0][1]) for c in fake_writer.call_args_list]
+    assert_in((b"fake", "chart7.png"), written)
+
+
+class _StrictDriver:
+    """An engine such as snapshot-selenium, without extra keyword arguments"""
+
+    def __init__(self):
+        self.delays = []
+
+    def make_snapshot(self, html_path, file_type, delay, pixel_ratio):
+        self.delays.append(delay)
+        return "data:image/png;base64,ZmFrZQ"
+
+
+@patch("pyecharts.render.snapshot.save_as_png")
+def test_snapshot_pool_default_engine(fake_writer):
+    driver = _StrictDriver()
+    with SnapshotPool(lambda: driver, size=1) as pool:
+        assert_equal(pool.map([("chart.html", "chart.png")]), ["chart.png"])
+    assert_equal(driver.delays, [2])
+
+
+class _FakeWebDriver:
+    def __init__(self):
+        self.urls = []
+        self.polls = 0
+        self.scripts = []
+        self.quit_called = False
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def execute_script(self, script):
+        if script == FINISHED_SCRIPT:
+            self.polls += 1
+            return self.polls >= 3
+        self.scripts.append(script)
+        return "data:image/png;base64,ZmFrZQ"
+
+    def quit(self):
+        self.quit_called = True
+
+
+@patch("pyecharts.render.snapshot.save_as_png")
+def test_webdriver_engine(fake_writer):
+    webdriver = _FakeWebDriver()
+    engine = WebDriverEngine(webdriver, interval=0)
+    pool = SnapshotPool(lambda: engine, size=1, ready_script=FINISHED_SCRIPT)
+    with pool:
+        pool.map([("chart.html", "chart.png")], pixel_ratio=1)
+
+    assert_true(webdriver.urls[0].startswith("file:///"))
+    assert_equal(webdriver.polls, 3)
+    assert_in("getDataURL({type: 'png', pixelRatio: 1", webdriver.scripts[0])
+    assert_true(webdriver.quit_called)
+    assert_equal(b"".join(fake_writer.call_args[0][0]), b"fake")
+
+
+@raises(TimeoutError)
+def test_webdriver_engine_timeout():
+    webdriver = _FakeWebDriver()
+    webdriver.polls = -10 ** 6
+    engine = WebDriverEngine(webdriver, timeout=0, interval=0)
+    engine.make_snapshot("chart.html", "png", ready_script=FINISHED_SCRIPT)
+
+
+class _FetchingEngine:
+    def make_snapshot(self, html_path, file_type, delay, pixel_ratio, **kwargs):
+        self.html = urllib.request.urlopen(html_path).read().decode("utf-8")
+        if file_type == "svg":
+            return "<svg></svg>"
+        if file_type == "gif":
+            return "data:image/gif;base64,R0lGODlh"
+        return "data:image/png;base64,ZmFrZQ"
+
+
+def test_make_snapshot_in_memory():
+    eng = _FetchingEngine()
+    chart = Bar().add_xaxis(["A"]).add_yaxis("series0", [1])
+    assert_equal(make_snapshot_in_memory(eng, chart), b"fake")
+    assert_in(chart.chart_id, eng.html)
+
+    assert_equal(make_snapshot_in_memory(eng, "<p>html</p>", "svg"), "<svg></svg>")
+    assert_equal(eng.html, "<p>html</p>")
+
+
+@raises(TypeError)
+def test_make_snapshot_in_memory_raise_type_error():
+    make_snapshot_in_memory(_FetchingEngine(), "<p>html</p>", "pngx")
+
+
+def test_make_snapshot_in_memory_same_mime_type():
+    # already a gif, written as it is without PIL
+    assert_equal(make_snapshot_in_memory(_FetchingEngine(), "<p/>", "gif"), b"GIF89a")
+
+
+def test_split_data_url():
+    assert_equal(split_data_url("data:image/png;base64,ZmFrZQ"), ("image/png", 22))
+    assert_equal(split_data_url("fake content1,content2"), ("fake content1", 14))
+
+
+def test_decode_base64_chunks():
+    data = "data:," + "cHllY2hhcnRzIGNodW5rcw"
+    expected = decode_base64(data[6:])
+    for chunk_size in (4, 8, 1 << 20):
+        chunks = list(decode_base64_chunks(data, 6, chunk_size))
+        assert_equal(b"".join(chunks), expected)
+    assert_equal(len(list(decode_base64_chunks(data, 6, 4))), 6)
+
+    wrapped = "cHllY2hh\ncnRzIGNodW5rcw"
+    assert_equal(b"".join(decode_base64_chunks(wrapped, chunk_size=4)), expected)
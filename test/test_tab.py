@@ -1,9 +1,9 @@
 from typing import Iterable
 from unittest.mock import patch
 
-from nose.tools import assert_equal, assert_in, assert_true
+from nose.tools import assert_equal, assert_in, assert_not_in, assert_true
 
-from pyecharts.charts import Bar, Line, Tab
+from pyecharts.charts import Bar, Line, Tab, Timeline
 from pyecharts.commons.utils import OrderedSet
 from pyecharts.components import Table
 from pyecharts.faker import Faker
@@ -84,3 +84,41 @@ def test_tab_attr():
     tab = Tab()
     assert_true(isinstance(tab.js_functions, OrderedSet))
     assert_true(isinstance(tab._charts, list))
+
+
+def test_tab_shared_options():
+    tab = Tab(is_shared_options=True)
+    tab.add(_create_bar(), "bar-example").add(_create_line(), "line-example")
+    content = tab.render_embed()
+    assert_in("var shared_options_", content)
+    for chart in tab:
+        assert_in('"color": shared_options_', chart.json_contents)
+    assert_in("shared_options_", tab.render_notebook().__html__())
+
+
+@patch("pyecharts.render.engine.write_utf8_html_file")
+def test_tab_lazy(fake_writer):
+    bar, line = _create_bar(), _create_line()
+    tab = Tab(is_lazy=True).add(bar, "bar").add(line, "line")
+    tab.add(_create_table(), "table").render()
+    _, content = fake_writer.call_args[0]
+    for c in (bar, line):
+        lazy = '<script type="text/x-pyecharts-chart" id="init_{}">'
+        assert_in(lazy.format(c.chart_id), content)
+    assert_in("function initLazyChart(chartID)", content)
+    # no chart is initialized on load
+    scripts = content.split('<script type="text/x-pyecharts-chart"')
+    assert_not_in("echarts.init(", scripts[0])
+    assert_not_in("echarts.init(", scripts[-1].split("</script>", 1)[1])
+
+
+def test_tab_diffed_timeline():
+    for is_shared_options in (False, True):
+        tl = Timeline(is_diff_frames=True)
+        for year in range(2015, 2018):
+            tl.add(_create_bar(), str(year))
+        page = Tab(is_shared_options=is_shared_options)
+        page.add(tl, "timeline").add(_create_bar(), "bar")
+        page.render_embed()
+        # the frames are diffed as when the timeline is dumped alone
+        assert_equal(tl.json_contents, tl.dump_options())
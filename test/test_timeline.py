@@ -1,11 +1,15 @@
+import json
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from nose.tools import assert_equal
 
 from pyecharts import options as opts
 from pyecharts.charts import Bar, Timeline
+from pyecharts.charts.base import OptionsEncoder
 from pyecharts.commons.utils import JsCode
 from pyecharts.faker import Faker
+from pyecharts.globals import CurrentConfig
 
 
 class TestTimeLine(unittest.TestCase):
@@ -121,3 +125,50 @@ def test_page_with_multi_axis():
     for t in tl.options.get("options"):
         assert "xAxis" in t
         assert "color" in t
+
+
+def test_timeline_dump_options_by_frame():
+    tl = Timeline()
+    for i in range(2015, 2020):
+        bar = Bar().add_xaxis(["a", "b"]).add_yaxis("商家A", [i, 1.5])
+        bar.set_global_opts(
+            tooltip_opts=opts.TooltipOpts(formatter=JsCode("function (x) {}"))
+        )
+        tl.add(bar, "{}年".format(i))
+    expected = OptionsEncoder().encode(tl.options)
+    assert_equal(tl.dump_options(), expected)
+
+    CurrentConfig.DUMP_EXECUTOR = ThreadPoolExecutor(2)
+    try:
+        assert_equal(tl.dump_options(), expected)
+    finally:
+        CurrentConfig.DUMP_EXECUTOR.shutdown()
+        CurrentConfig.DUMP_EXECUTOR = None
+
+
+def test_timeline_diff_frames():
+    tl = Timeline(is_diff_frames=True)
+    for i in range(3):
+        bar = (
+            Bar()
+            .add_xaxis(["a", "b"])
+            .add_yaxis("shop a", [i, 1])
+            .add_yaxis("shop b", [3, 4], stack="s" if i == 1 else None)
+            .set_global_opts(title_opts=opts.TitleOpts(title="year"))
+        )
+        tl.add(bar, str(i))
+    options = json.loads(tl.dump_options())
+    assert_equal(
+        options["options"],
+        [
+            {"series": [{"data": [0, 1]}, {}]},
+            {"series": [{"data": [1, 1]}, {"stack": "s"}]},
+            {"series": [{"data": [2, 1]}, {}]},
+        ],
+    )
+    base = options["baseOption"]
+    assert_equal(base["title"], [{"text": "year", "padding": 5, "itemGap": 10}])
+    assert_equal(base["series"][1]["data"], [3, 4])
+    assert_equal(base["series"][0]["name"], "shop a")
+    assert "data" not in base["series"][0]
+    assert_equal(json.loads(tl.dump_options_with_quotes()), options)
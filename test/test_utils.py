@@ -1,4 +1,6 @@
-from nose.tools import assert_equal
+import array
+
+from nose.tools import assert_equal, assert_true
 
 from pyecharts.commons import utils
 
@@ -19,3 +21,42 @@ def test_ordered_set():
     s = utils.OrderedSet()
     s.add("a", "b", "c")
     assert_equal(s.items, ["a", "b", "c"])
+
+
+def test_zip_columns():
+    assert_equal(utils.zip_columns(["a", "b"], [1, 2]), [["a", 1], ["b", 2]])
+
+    data = utils.zip_columns(["a", "b"], array.array("d", [1, 2]))
+    assert_true(isinstance(data, utils.ColumnarData))
+    assert_equal(len(data), 2)
+    assert_equal(data[1], ["b", 2.0])
+    assert_equal(list(data), [["a", 1.0], ["b", 2.0]])
+
+
+def test_is_numeric_buffer():
+    assert_true(utils.is_numeric_buffer(array.array("i", [1])))
+    assert_true(utils.is_numeric_buffer(memoryview(b"ab")))
+    assert_equal(utils.is_numeric_buffer(array.array("u", "ab")), False)
+    assert_equal(utils.is_numeric_buffer([1, 2]), False)
+
+
+def test_iter_replace_placeholder():
+    html = 'a "--x_x--0_0--fn()--x_x--0_0--", --x_x--0_0--b'
+    expected = utils.replace_placeholder(html)
+    for size in range(1, len(html) + 1):
+        chunks = [html[i:][:size] for i in range(0, len(html), size)]
+        assert_equal("".join(utils.iter_replace_placeholder(chunks)), expected)
+
+
+def test_tracked_dict():
+    d = utils.TrackedDict(a=[1], b=2)
+    assert_equal(d, {"a": [1], "b": 2})
+    versions = dict(d.versions)
+    d["a"].append(2)
+    assert_equal(d.versions["a"], versions["a"] + 1)
+    assert_equal(d.versions["b"], versions["b"])
+    d.update(c=3)
+    d.pop("b")
+    assert_equal(d.versions["b"], versions["b"] + 1)
+    assert_equal(d.versions["c"], 1)
+    assert_equal(list(d.items()), [("a", [1, 2]), ("c", 3)])